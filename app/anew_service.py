@@ -1,9 +1,11 @@
+import hashlib
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from summary.services import NewsSummaryService
-from summary.models import NewsSummaryRequest, NewsSummaryResponse, NewsSummaryItem
+from summary.models import NewsSummaryRequest, NewsSummaryResponse, NewsSummaryItem, NewsCluster
 from database import mongodb
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +14,43 @@ class AnewService:
     def __init__(self):
         self.news_summary_service = NewsSummaryService()
     
+    def _get_article_hashes(self, 
+                            news_list: List[Dict[str, Any]], 
+                            clusters: Optional[List[NewsCluster]]) -> List[str]:
+        """요약 대상 기사 집합의 지문 (URL + 본문 해시, 정렬)"""
+        def article_hash(url: Optional[str], content: Optional[str] = None) -> str:
+            return hashlib.sha1(f"{url}\n{content or ''}".encode("utf-8")).hexdigest()[:16]
+        
+        if clusters is None:
+            return sorted(article_hash(news.get("url"), news.get("content")) for news in news_list)
+        
+        hashes = []
+        for cluster in clusters:
+            hashes.extend(article_hash(article.get("url"), article.get("content")) for article in cluster.articles)
+            hashes.extend(article_hash(url) for url in cluster.duplicate_urls)
+        return sorted(hashes)
+    
+    def _find_reusable_summary(self, article_hashes: List[str]) -> Optional[str]:
+        """직전 요약의 기사 집합과 충분히 겹치면 직전 요약 ID 반환"""
+        try:
+            previous = mongodb.get_recent_article_hashes()
+        except Exception as e:
+            logger.warning(f"직전 요약 지문 조회 실패, 새로 요약합니다: {e}")
+            return None
+        if not previous or not previous.get("article_hashes") or not article_hashes:
+            return None
+        
+        current, last = set(article_hashes), set(previous["article_hashes"])
+        overlap = len(current & last) / len(current | last)
+        logger.info(f"직전 요약과 기사 집합 유사도: {overlap:.2f} (기준 {settings.summary_reuse_threshold})")
+        if overlap >= settings.summary_reuse_threshold:
+            return previous["_id"]
+        return None
+    
     def process_and_save_summary(self, 
                                 news_list: List[Dict[str, Any]], 
-                                max_length: Optional[int] = None):
+                                max_length: Optional[int] = None,
+                                article_ids: Optional[Dict[str, Any]] = None):
         try:
             # 1. 뉴스 요약 요청 생성
             request = NewsSummaryRequest(
@@ -22,11 +58,30 @@ class AnewService:
                 max_length=max_length or 200
             )
             
-            # 2. NewsSummaryService를 사용하여 요약 생성
+            # 2. 수집한 기사 원문 저장 (URL 기준 upsert, 요약에서는 기사 ID로 참조)
+            #    동시 수집은 수집 중에 이미 저장했으므로 전달받은 ID를 그대로 사용
+            if article_ids is None:
+                article_ids = {}
+                try:
+                    article_ids = mongodb.upsert_articles(news_list)
+                except Exception as e:
+                    logger.warning(f"기사 원문 저장 실패, 기사 참조 없이 진행합니다: {e}")
+            
+            # 3. 요약 대상 기사 집합이 직전 실행과 거의 같으면 LLM 호출 생략
+            clusters = None
+            if self.news_summary_service.uses_clusters():
+                clusters = self.news_summary_service.build_clusters(news_list)
+            article_hashes = self._get_article_hashes(news_list, clusters)
+            reusable_id = self._find_reusable_summary(article_hashes)
+            if reusable_id:
+                logger.info(f"기사 집합 변화가 적어 직전 요약을 재사용합니다: ID={reusable_id}")
+                return
+            
+            # 4. NewsSummaryService를 사용하여 요약 생성
             logger.info(f"뉴스 요약 시작: {len(news_list)}개 뉴스")
-            summary_response = self.news_summary_service.summarize_news(request)
+            summary_response = self.news_summary_service.summarize_news(request, clusters)
             
-            # 3. NewsSummaryItem을 딕셔너리로 변환
+            # 5. NewsSummaryItem을 딕셔너리로 변환
             summary_items = []
             for item in summary_response.summary:
                 summary_items.append({
@@ -44,9 +99,9 @@ class AnewService:
                     "reference_url": item.reference_url
                 })
             
-            # 4. MongoDB에 저장
+            # 6. MongoDB에 저장
             logger.info(f"MongoDB에 요약 데이터 저장 시작: {len(summary_items)}개 요약")
-            inserted_id = mongodb.insert_summary_items(summary_items)
+            inserted_id = mongodb.insert_summary_items(summary_items, article_hashes, article_ids)
 
             logger.info(f"요약 및 저장 완료: ID={inserted_id}")
         except Exception as e:
@@ -74,6 +129,7 @@ class AnewService:
             result = mongodb.collection.delete_one({"_id": ObjectId(summary_id)})
             
             if result.deleted_count > 0:
+                mongodb.notify_summary_changed(summary_id)
                 logger.info(f"요약 데이터 삭제 성공: ID={summary_id}")
                 return True
             else:
@@ -0,0 +1,161 @@
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from config import settings
+from database import convert_objectid_to_str
+from news_url import normalizeNewsUrl
+from logger import get_logger
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+from bson import ObjectId
+
+logger = get_logger()
+
+# 요약 이력 조회용 프로젝션
+HISTORY_PROJECTIONS = {
+    # 타임라인: 주제 제목만
+    "titles": {"created_at": 1, "item_count": 1, "summary_items.title": 1},
+    # 전체 요약 (내부용 기사 지문 제외)
+    "full": {"article_hashes": 0, "fingerprint": 0},
+}
+
+class AsyncMongoDB:
+    """FastAPI 요청 처리용 비동기 MongoDB 클라이언트 (스케줄러는 동기 database.MongoDB 사용)"""
+    def __init__(self):
+        self.client: Optional[AsyncMongoClient] = None
+        self.database: Optional[AsyncDatabase] = None
+        self.collection: Optional[AsyncCollection] = None
+        self.articles: Optional[AsyncCollection] = None
+        self.triggers: Optional[AsyncCollection] = None
+        
+    async def connect(self):
+        try:
+            self.client = AsyncMongoClient(
+                settings.mongodb_uri,
+                maxPoolSize=settings.mongodb_max_pool_size,
+                minPoolSize=settings.mongodb_min_pool_size,
+                serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+                connectTimeoutMS=settings.mongodb_connect_timeout_ms,
+                socketTimeoutMS=settings.mongodb_socket_timeout_ms,
+                waitQueueTimeoutMS=settings.mongodb_wait_queue_timeout_ms
+            )
+            # 연결 테스트
+            await self.client.admin.command('ping')
+            logger.info("MongoDB(async) 연결 성공")
+            
+            self.database = self.client[settings.mongodb_database]
+            self.collection = self.database[settings.mongodb_collection]
+            self.articles = self.database[settings.mongodb_articles_collection]
+            self.triggers = self.database[settings.mongodb_trigger_collection]
+            
+        except Exception as e:
+            logger.error(f"MongoDB(async) 연결 실패: {e}")
+            raise Exception(f"MongoDB 연결에 실패했습니다: {str(e)}")
+    
+    async def disconnect(self):
+        if self.client:
+            await self.client.close()
+            logger.info("MongoDB(async) 연결 해제")
+    
+    def get_collection(self) -> AsyncCollection:
+        if self.collection is None:
+            raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+        return self.collection
+    
+    async def get_recent_summary_item(self) -> Optional[Dict[str, Any]]:
+        """가장 최근 NewsSummaryItem 조회"""
+        try:
+            result = await self.get_collection().find_one(sort=[("_id", -1)])
+            if result:
+                return convert_objectid_to_str(result)
+            return None
+        except Exception as e:
+            logger.error(f"NewsSummaryItem 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+    
+    async def get_recent_summary_id(self) -> Optional[str]:
+        """가장 최근 요약의 _id만 조회 (캐시 버전 확인용)"""
+        try:
+            result = await self.get_collection().find_one({}, {"_id": 1}, sort=[("_id", -1)])
+            return str(result["_id"]) if result else None
+        except Exception as e:
+            logger.error(f"최근 요약 ID 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+    
+    async def get_summary_items_by_id(self, summary_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 NewsSummaryItem 목록 조회"""
+        try:
+            result = await self.get_collection().find_one({"_id": ObjectId(summary_id)}, HISTORY_PROJECTIONS["full"])
+            if result:
+                return convert_objectid_to_str(result)
+            return result
+        except Exception as e:
+            logger.error(f"NewsSummaryItem 목록 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+
+    async def get_summary_history(self, 
+                                  limit: int, 
+                                  cursor: Optional[str] = None, 
+                                  view: str = "titles") -> Dict[str, Any]:
+        """요약 이력 최신순 조회 (_id 기준 keyset 페이지네이션)
+        
+        cursor는 이전 페이지의 next_cursor이며, 그보다 오래된 요약만 반환한다.
+        """
+        try:
+            query = {"_id": {"$lt": ObjectId(cursor)}} if cursor else {}
+            documents: List[Dict[str, Any]] = await self.get_collection().find(
+                query, HISTORY_PROJECTIONS[view]
+            ).sort("_id", -1).limit(limit + 1).to_list(length=limit + 1)
+            
+            # 한 건 더 조회하여 다음 페이지 존재 여부 판단
+            has_more = len(documents) > limit
+            documents = documents[:limit]
+            next_cursor = str(documents[-1]["_id"]) if has_more else None
+            return {"items": convert_objectid_to_str(documents), "next_cursor": next_cursor}
+        except Exception as e:
+            logger.error(f"요약 이력 조회 실패: {e}")
+            raise Exception(f"데이터 목록 조회에 실패했습니다: {str(e)}")
+
+    async def get_article_by_id(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """기사 _id로 저장된 기사 원문 조회 (요약 항목의 reference_article_ids 해석용)"""
+        try:
+            if self.articles is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = await self.articles.find_one({"_id": ObjectId(article_id)})
+            if result:
+                return convert_objectid_to_str(result)
+            return None
+        except Exception as e:
+            logger.error(f"기사 원문 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+
+    async def get_article_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """기사 URL로 저장된 기사 원문 조회 (요약 항목의 reference_url 해석용)"""
+        try:
+            if self.articles is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = await self.articles.find_one({"url": normalizeNewsUrl(url)})
+            if result:
+                return convert_objectid_to_str(result)
+            return None
+        except Exception as e:
+            logger.error(f"기사 원문 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+
+    async def insert_crawl_trigger(self, source: str) -> str:
+        """수동 크롤링 실행 요청 등록 (이미 대기 중인 요청이 있으면 그 요청 ID 반환)"""
+        try:
+            if self.triggers is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = await self.triggers.find_one_and_update(
+                {"status": "pending"},
+                {"$setOnInsert": {"status": "pending", "source": source, "requested_at": datetime.now()}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return str(result["_id"])
+        except Exception as e:
+            logger.error(f"수동 실행 요청 저장 실패: {e}")
+            raise Exception(f"수동 실행 요청 저장에 실패했습니다: {str(e)}")
+
+async_mongodb = AsyncMongoDB()
@@ -10,13 +10,80 @@ class Settings:
     fallback_models: list = os.getenv("FALLBACK_MODELS", "gemini-1.5-pro,gemini-1.0-pro").split(",")
     max_tokens: int = int(os.getenv("MAX_TOKENS", "500"))
     temperature: float = float(os.getenv("TEMPERATURE", "0.7"))
+    llm_streaming: bool = os.getenv("LLM_STREAMING", "true").lower() == "true"  # single 모드 응답을 스트리밍으로 받아 항목별 파싱
+    llm_circuit_failure_threshold: int = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "3"))  # 연속 503 횟수가 이 이상이면 서킷 열림
+    llm_circuit_cooldown: float = float(os.getenv("LLM_CIRCUIT_COOLDOWN", "600"))  # 서킷 유지 시간 (초)
+    llm_hedge_enabled: bool = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"  # 지연 시 다음 모델로 헤지 요청
+    llm_hedge_delay: float = float(os.getenv("LLM_HEDGE_DELAY", "20"))  # 헤지 요청까지 대기 시간 (초)
     summary_news_count: int = int(os.getenv("SUMMARY_NEWS_COUNT", "3"))
+    prompt_token_budget: int = int(os.getenv("PROMPT_TOKEN_BUDGET", "16000"))  # 프롬프트 1개당 예상 토큰 상한
+    prompt_min_article_tokens: int = int(os.getenv("PROMPT_MIN_ARTICLE_TOKENS", "80"))  # 기사 본문 최소 보장 토큰
+    prompt_hangul_chars_per_token: float = float(os.getenv("PROMPT_HANGUL_CHARS_PER_TOKEN", "1.5"))  # 토큰 추정용 (한글)
+    prompt_chars_per_token: float = float(os.getenv("PROMPT_CHARS_PER_TOKEN", "4"))  # 토큰 추정용 (그 외 문자)
+    summary_mode: str = os.getenv("SUMMARY_MODE", "map_reduce").lower()  # map_reduce(주제별 동시 요청) | single(한 번에 요청)
+    summary_concurrency: int = int(os.getenv("SUMMARY_CONCURRENCY", "3"))  # map_reduce 동시 요청 수
+    summary_topic_retries: int = int(os.getenv("SUMMARY_TOPIC_RETRIES", "1"))  # 주제별 재시도 횟수
+    summary_pre_cluster: bool = os.getenv("SUMMARY_PRE_CLUSTER", "true").lower() == "true"  # LLM 호출 전 로컬 주제 클러스터링
+    cluster_similarity_threshold: float = float(os.getenv("CLUSTER_SIMILARITY_THRESHOLD", "0.3"))  # 같은 주제로 묶는 코사인 유사도
+    duplicate_similarity_threshold: float = float(os.getenv("DUPLICATE_SIMILARITY_THRESHOLD", "0.8"))  # 중복 기사로 합치는 코사인 유사도
+    summary_reuse_threshold: float = float(os.getenv("SUMMARY_REUSE_THRESHOLD", "0.8"))  # 직전 요약과 기사 집합 유사도가 이 이상이면 재사용 (1 초과면 항상 새로 요약)
     max_news_by_media: int = int(os.getenv("MAX_NEWS_BY_MEDIA", "10"))  # 언론사별 최대 뉴스 개수
     
+    # 크롤링 설정
+    crawl_backend: str = os.getenv("CRAWL_BACKEND", "http").lower()  # http(실패 시 selenium 폴백) | selenium
+    http_timeout: float = float(os.getenv("HTTP_TIMEOUT", "10"))  # 초 단위
+    http_retries: int = int(os.getenv("HTTP_RETRIES", "2"))
+    http_pool_size: int = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    page_wait_timeout: float = float(os.getenv("PAGE_WAIT_TIMEOUT", "10"))  # 페이지 준비 대기 최대 시간 (초)
+    page_wait_poll: float = float(os.getenv("PAGE_WAIT_POLL", "0.05"))  # 준비 상태 확인 주기 (초)
+    browser_lean_profile: bool = os.getenv("BROWSER_LEAN_PROFILE", "true").lower() == "true"  # 이미지/미디어/폰트/외부 광고·추적 요청 차단 + eager 로딩
+    browser_blocked_urls: list = [
+        pattern.strip() for pattern in os.getenv(
+            "BROWSER_BLOCKED_URLS",
+            "*.png*,*.jpg*,*.jpeg*,*.gif*,*.webp*,*.svg*,*.ico*,*.mp4*,*.webm*,*.m3u8*,*.woff*,*.ttf*,*.otf*,"
+            "*imgnews.pstatic.net*,*doubleclick.net*,*googlesyndication.com*,*google-analytics.com*,"
+            "*googletagmanager.com*,*adnxs.com*,*criteo.com*,*facebook.net*,*veta.naver.com*"
+        ).split(",") if pattern.strip()
+    ]
+    browser_page_load_timeout: float = float(os.getenv("BROWSER_PAGE_LOAD_TIMEOUT", "20"))  # driver.get 최대 대기 (초), 초과 시 로딩 중단 후 진행
+    driver_max_pages: int = int(os.getenv("DRIVER_MAX_PAGES", "200"))  # 이 페이지 수마다 WebDriver 재시작 (0이면 사용 안 함)
+    driver_max_rss_mb: int = int(os.getenv("DRIVER_MAX_RSS_MB", "1024"))  # chromedriver+Chromium RSS 상한 (MB, 0이면 사용 안 함)
+    browser_page_stats: bool = os.getenv("BROWSER_PAGE_STATS", "true").lower() == "true"  # 성능 로그로 페이지별 요청 수/전송량/차단 수 집계
+    dom_extraction: str = os.getenv("DOM_EXTRACTION", "local").lower()  # local(page_source 1회 + 로컬 파싱) | webdriver(셀렉터별 find_element)
+    crawl_incremental: bool = os.getenv("CRAWL_INCREMENTAL", "true").lower() == "true"  # 언론사별 마지막 기사 이후만 목록 조회
+    crawl_workers: int = int(os.getenv("CRAWL_WORKERS", "4"))  # 1이면 순차 수집
+    crawl_upsert_batch: int = int(os.getenv("CRAWL_UPSERT_BATCH", "20"))  # 동시 수집 중 articles에 한 번에 저장할 기사 수
+    crawl_host_rate_limit: float = float(os.getenv("CRAWL_HOST_RATE_LIMIT", "5"))  # 호스트별 초당 최대 요청 수 (0이면 제한 없음)
+    
     # MongoDB 설정
     mongodb_uri: str = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
     mongodb_database: str = os.getenv("MONGODB_DATABASE", "news_summary")
     mongodb_collection: str = os.getenv("MONGODB_COLLECTION", "summaries")
+    mongodb_articles_collection: str = os.getenv("MONGODB_ARTICLES_COLLECTION", "articles")
+    mongodb_max_pool_size: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+    mongodb_min_pool_size: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+    mongodb_server_selection_timeout_ms: int = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    mongodb_connect_timeout_ms: int = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "5000"))
+    mongodb_socket_timeout_ms: int = int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "10000"))
+    mongodb_wait_queue_timeout_ms: int = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000"))  # 커넥션 풀 대기 상한
+    mongodb_crawl_state_collection: str = os.getenv("MONGODB_CRAWL_STATE_COLLECTION", "crawl_state")
+    mongodb_llm_cache_collection: str = os.getenv("MONGODB_LLM_CACHE_COLLECTION", "llm_cache")
+    mongodb_lock_collection: str = os.getenv("MONGODB_LOCK_COLLECTION", "scheduler_locks")
+    mongodb_trigger_collection: str = os.getenv("MONGODB_TRIGGER_COLLECTION", "crawl_triggers")
+    
+    # 기사 캐시 설정 (articles 컬렉션에서 최근에 본 기사는 상세 페이지를 다시 열지 않음)
+    article_cache_enabled: bool = os.getenv("ARTICLE_CACHE_ENABLED", "true").lower() == "true"
+    article_cache_ttl: float = float(os.getenv("ARTICLE_CACHE_TTL", "24"))  # 시간 단위 (last_seen_at 기준)
+    
+    # LLM 응답 캐시 설정
+    llm_cache_backend: str = os.getenv("LLM_CACHE_BACKEND", "disk").lower()  # disk | mongodb | none
+    llm_cache_dir: str = os.getenv("LLM_CACHE_DIR", "cache/llm")
+    llm_cache_ttl: float = float(os.getenv("LLM_CACHE_TTL", "24"))  # 시간 단위
+    llm_cache_max_entries: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+    
+    # API 요약 캐시 설정
+    summary_cache_poll_interval: float = float(os.getenv("SUMMARY_CACHE_POLL_INTERVAL", "30"))  # 최신 요약 버전 확인 주기 (초)
+    summary_cache_change_stream: bool = os.getenv("SUMMARY_CACHE_CHANGE_STREAM", "false").lower() == "true"  # 레플리카셋에서 변경 스트림으로 즉시 무효화
     
     # 로그 설정
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -26,5 +93,13 @@ class Settings:
     # 스케줄러 설정
     schedule_interval: int = int(os.getenv("SCHEDULE_INTERVAL", "4"))  # 시간 단위
     schedule_enabled: bool = os.getenv("SCHEDULE_ENABLED", "true").lower() == "true"
+    schedule_jitter: int = int(os.getenv("SCHEDULE_JITTER", "60"))  # 초 단위, 정기 실행 시각에 0~N초 무작위 지연
+    schedule_misfire_policy: str = os.getenv("SCHEDULE_MISFIRE_POLICY", "run_once")  # run_once | skip
+    schedule_misfire_grace: int = int(os.getenv("SCHEDULE_MISFIRE_GRACE", "1800"))  # 초 단위, 이보다 늦은 일정은 건너뜀
+    schedule_trigger_poll: int = int(os.getenv("SCHEDULE_TRIGGER_POLL", "10"))  # 초 단위 수동 실행 요청 확인 주기
+    schedule_trigger_token: str = os.getenv("SCHEDULE_TRIGGER_TOKEN", "")  # 비어 있으면 수동 실행 API 비활성화, 설정 시 X-Trigger-Token 헤더 필요
+    scheduler_lock_enabled: bool = os.getenv("SCHEDULER_LOCK_ENABLED", "true").lower() == "true"  # 여러 프로세스 중 리더 하나만 크롤링
+    scheduler_lock_lease: int = int(os.getenv("SCHEDULER_LOCK_LEASE", "60"))  # 초 단위, 갱신이 끊기면 이 시간 뒤 다른 프로세스가 인계
+    scheduler_lock_heartbeat: int = int(os.getenv("SCHEDULER_LOCK_HEARTBEAT", "20"))  # 초 단위 리스 갱신 주기
 
 settings = Settings() 
\ No newline at end of file
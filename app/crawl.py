@@ -1,10 +1,26 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urljoin, urlparse
+import json
+import requests
+import threading
 import time
 from datetime import datetime
 from config import settings
+from logger import get_logger
+from metrics import metrics
+from news_url import getArticleId, getOidFromUrl
+from driver_manager import DriverManager
+
+logger = get_logger()
 
 mediaIdList = {
     "009": "매일경제",
@@ -17,32 +33,166 @@ mediaIdList = {
 
 # 언론사별 최대 뉴스 개수는 config.py에서 설정
 
-def getNewsUrlByMediaId(driver, mediaId):
-    urls = []
+# 목록/상세 페이지 CSS 셀렉터 (Selenium/HTTP 경로 공용)
+LIST_ITEM_SELECTORS = ["ul.type06_headline li", "ul.type06 li"]
+TITLE_SELECTORS = [".media_end_head_headline", "h2#title", ".end_tit", ".ArticleHead_article_title__qh8GV"]
+CONTENT_SELECTORS = ["#newsct_article", ".article_body", "#articleBody", "._article_content", ".newsct_article _article_body"]
+
+NEWS_PER_LIST_PAGE = 20
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+class HostRateLimiter:
+    """호스트별 초당 요청 수 제한 (여러 워커가 공유)"""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_allowed = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            allowed_at = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = allowed_at + self.interval
+        delay = allowed_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+host_rate_limiter = HostRateLimiter(settings.crawl_host_rate_limit)
+
+def getListUrl(mediaId, page):
+    """언론사 기사 목록 페이지 URL 생성 (2페이지 이상이면 date와 page 필요)"""
+    if page == 1:
+        return f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={mediaId}"
     today_str = datetime.today().strftime("%Y%m%d")
+    return f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={mediaId}&date={today_str}&page={page}"
+
+def waitForPage(driver, selectors, url):
+    """셀렉터 중 하나가 나타나면 즉시 반환 (페이지별 타임아웃), 실제 대기 시간 기록"""
+    started = time.monotonic()
+    try:
+        WebDriverWait(driver, settings.page_wait_timeout, poll_frequency=settings.page_wait_poll).until(
+            EC.any_of(*[EC.presence_of_element_located((By.CSS_SELECTOR, sel)) for sel in selectors])
+        )
+        ready = True
+    except TimeoutException:
+        ready = False
+        metrics.incr("crawl.page_wait_timeout")
+        logger.warning(f"[Crawl] 페이지 준비 대기 시간 초과 ({settings.page_wait_timeout}초): {url}")
+    elapsed = time.monotonic() - started
+    metrics.observe("crawl.page_wait", elapsed)
+    logger.debug(f"[Crawl] 페이지 준비 대기 {elapsed * 1000:.0f}ms: {url}")
+    return ready
+
+def applyLeanProfile(options):
+    """텍스트만 읽는 크롤러용 경량 Chrome 옵션 (이미지/미디어 비활성화, eager 로딩, 성능 로그)"""
+    if settings.browser_lean_profile:
+        # DOMContentLoaded 시점에 driver.get 반환 (이미지/광고 iframe 로딩을 기다리지 않음)
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+    if settings.browser_page_stats:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+def setupDriverNetwork(driver):
+    """드라이버 생성 직후 페이지 로드 타임아웃과 DevTools 요청 차단(폰트/미디어/외부 광고·추적) 적용"""
+    driver.set_page_load_timeout(settings.browser_page_load_timeout)
+    if settings.browser_lean_profile and settings.browser_blocked_urls:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": settings.browser_blocked_urls})
+    return driver
+
+def recordPageStats(driver, url):
+    """직전 페이지 로드의 요청 수/전송 바이트/차단 요청 수 집계 (성능 로그는 읽으면 비워짐)"""
+    if not settings.browser_page_stats:
+        return
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logger.debug(f"[Crawl] 성능 로그 조회 실패: {e}")
+        return
+
+    sent, blocked, transferred = 0, 0, 0
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            sent += 1
+        elif method == "Network.loadingFinished":
+            transferred += params.get("encodedDataLength", 0)
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked += 1
+
+    metrics.incr("browser.pages")
+    metrics.incr("browser.requests", sent)
+    metrics.incr("browser.requests_blocked", blocked)
+    metrics.incr("browser.bytes_transferred", transferred)
+    logger.debug(f"[Crawl] 페이지 요청 {sent}개 (차단 {blocked}개), 전송 {transferred / 1024:.1f}KB: {url}")
+
+def loadPage(driver, url, selectors):
+    """페이지 로드 후 셀렉터 대기 (로드 타임아웃 시 로딩을 멈추고 이미 받은 DOM으로 진행)"""
+    host_rate_limiter.wait(url)
+    try:
+        driver.get(url)
+    except TimeoutException:
+        metrics.incr("browser.page_load_timeout")
+        logger.warning(f"[Crawl] 페이지 로드 시간 초과 ({settings.browser_page_load_timeout}초): {url}")
+        try:
+            driver.execute_script("window.stop();")
+        except Exception:
+            pass
+    ready = waitForPage(driver, selectors, url)
+    recordPageStats(driver, url)
+    return ready
+
+def isSeenArticle(news_url, since_aid):
+    """이전 크롤링에서 이미 본 기사인지 여부 (high-water mark 이하)"""
+    if since_aid is None:
+        return False
+    aid = getArticleId(news_url)
+    return aid is not None and aid <= since_aid
+
+def getNewsUrlByMediaId(driver, mediaId, since_aid=None):
+    urls = []
 
     for i in range(settings.max_news_by_media):
-        page = (i // 20) + 1
-        page_offset = i % 20
+        page = (i // NEWS_PER_LIST_PAGE) + 1
+        page_offset = i % NEWS_PER_LIST_PAGE
 
         if page_offset == 0:
-            # URL 생성 (2페이지 이상이면 date와 page 필요)
-            if page == 1:
-                url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={mediaId}"
-            else:
-                url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={mediaId}&date={today_str}&page={page}"
+            list_url = getListUrl(mediaId, page)
+            loadPage(driver, list_url, LIST_ITEM_SELECTORS)
 
-            driver.get(url)
-            time.sleep(1)
-
-            headline_items = driver.find_elements(By.CSS_SELECTOR, "ul.type06_headline li")
-            type06_items = driver.find_elements(By.CSS_SELECTOR, "ul.type06 li")
-            all_items = headline_items + type06_items  # 총 20개 기사
+            all_items = []
+            for sel in LIST_ITEM_SELECTORS:
+                all_items += driver.find_elements(By.CSS_SELECTOR, sel)  # 총 20개 기사
 
         try:
             item = all_items[page_offset]
             a_tag = item.find_element(By.CSS_SELECTOR, "a")
             news_url = a_tag.get_attribute("href")
+            # 목록은 최신순이므로 이미 본 기사에 도달하면 이후는 모두 이전 기사
+            if isSeenArticle(news_url, since_aid):
+                break
             urls.append(news_url)
 
             if len(urls) >= settings.max_news_by_media:
@@ -55,14 +205,76 @@ def getNewsUrlByMediaId(driver, mediaId):
 
     return urls
 
+class SelectorStats:
+    """언론사(oid)별 셀렉터 적중 횟수를 기록하고, 많이 맞은 셀렉터부터 시도하도록 순서 조정"""
+    def __init__(self):
+        self._hits = {}
+        self._lock = threading.Lock()
+
+    def ordered(self, key, selectors):
+        with self._lock:
+            hits = self._hits.get(key, {})
+            return sorted(selectors, key=lambda sel: -hits.get(sel, 0))
+
+    def record(self, key, selector):
+        with self._lock:
+            hits = self._hits.setdefault(key, {})
+            hits[selector] = hits.get(selector, 0) + 1
+
+selector_stats = SelectorStats()
+
+def parseHtml(html):
+    return BeautifulSoup(html, "lxml")
+
+def selectText(soup, selectors, separator=""):
+    """셀렉터를 순서대로 시도하여 처음으로 텍스트가 있는 요소의 (텍스트, 셀렉터) 반환"""
+    for sel in selectors:
+        elem = soup.select_one(sel)
+        if elem is None:
+            continue
+        text = elem.get_text(separator, strip=True)
+        if text:
+            return text, sel
+    return None, None
+
+def extractNews(soup, news_url):
+    """파싱된 기사 HTML에서 제목/본문을 로컬로 추출하고 적중한 셀렉터를 기록"""
+    # 화면에 보이지 않는 스크립트/스타일 텍스트 제외 (Selenium .text와 동일하게)
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+
+    oid = getOidFromUrl(news_url)
+    title, title_sel = selectText(soup, selector_stats.ordered(("title", oid), TITLE_SELECTORS))
+    content, content_sel = selectText(soup, selector_stats.ordered(("content", oid), CONTENT_SELECTORS), separator="\n")
+
+    for field, sel in (("title", title_sel), ("content", content_sel)):
+        if sel:
+            selector_stats.record((field, oid), sel)
+            metrics.incr(f"crawl.selector.{field}.{sel}")
+        else:
+            metrics.incr(f"crawl.selector.{field}.miss")
+    logger.debug(f"[Crawl] 셀렉터 적중 oid={oid} title={title_sel} content={content_sel}: {news_url}")
+
+    return {
+        "title": title,
+        "content": content
+    }
+
 def getNews(driver, news_url):
-    driver.get(news_url)
-    time.sleep(1)
+    loadPage(driver, news_url, CONTENT_SELECTORS)
+
+    if settings.dom_extraction == "local":
+        # page_source 한 번만 가져와서 셀렉터 폴백은 로컬에서 평가
+        try:
+            return extractNews(parseHtml(driver.page_source), news_url)
+        except:
+            return None
+
     title = None  # 제목
     content = None  # 본문
 
     try:
-        for sel in [".media_end_head_headline", "h2#title", ".end_tit", ".ArticleHead_article_title__qh8GV"]:
+        for sel in TITLE_SELECTORS:
             try:
                 elem = driver.find_element(By.CSS_SELECTOR, sel)
                 title = elem.text.strip()
@@ -71,7 +283,7 @@ def getNews(driver, news_url):
             except:
                 continue
 
-        for sel in ["#newsct_article", ".article_body", "#articleBody", "._article_content", ".newsct_article _article_body"]:
+        for sel in CONTENT_SELECTORS:
             try:
                 elem = driver.find_element(By.CSS_SELECTOR, sel)
                 content = elem.text.strip()
@@ -85,4 +297,117 @@ def getNews(driver, news_url):
             "content": content
         }
     except:
-        return None
\ No newline at end of file
+        return None
+
+def createHttpSession():
+    """커넥션 풀을 사용하는 HTTP 세션 생성 (브라우저 없이 목록/상세 페이지 조회)"""
+    session = requests.Session()
+    retry = Retry(
+        total=settings.http_retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_size,
+        pool_maxsize=settings.http_pool_size,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+def fetchPage(session, url):
+    """HTTP로 페이지를 가져와 파싱된 HTML 반환"""
+    host_rate_limiter.wait(url)
+    response = session.get(url, timeout=settings.http_timeout)
+    response.raise_for_status()
+    # 인코딩은 문서의 meta charset 기준으로 파서가 판별
+    return parseHtml(response.content)
+
+def fetchNewsUrlByMediaId(session, mediaId, since_aid=None):
+    """HTTP 경로: 언론사 목록 페이지에서 기사 URL 수집 (since_aid 이하 기사에 도달하면 중단)"""
+    urls = []
+    max_pages = (settings.max_news_by_media - 1) // NEWS_PER_LIST_PAGE + 1
+
+    for page in range(1, max_pages + 1):
+        list_url = getListUrl(mediaId, page)
+        soup = fetchPage(session, list_url)
+
+        all_items = []
+        for sel in LIST_ITEM_SELECTORS:
+            all_items += soup.select(sel)
+        if not all_items:
+            if page == 1:
+                raise ValueError(f"목록 항목을 찾을 수 없습니다: {list_url}")
+            break
+
+        for item in all_items:
+            a_tag = item.select_one("a[href]")
+            if a_tag is None:
+                continue
+            news_url = urljoin(list_url, a_tag["href"])
+            if isSeenArticle(news_url, since_aid):
+                return urls
+            urls.append(news_url)
+            if len(urls) >= settings.max_news_by_media:
+                return urls
+
+    return urls
+
+def fetchNews(session, news_url):
+    """HTTP 경로: 기사 상세 페이지에서 제목/본문 추출 (추출 실패 시 None)"""
+    try:
+        soup = fetchPage(session, news_url)
+    except requests.RequestException:
+        return None
+
+    details = extractNews(soup, news_url)
+    if not details["title"] or not details["content"]:
+        return None
+    return details
+
+class CrawlWorker:
+    """HTTP 세션과 WebDriver를 각자 소유하는 크롤링 워커 (워커 간 공유 금지)"""
+    def __init__(self, driver_factory):
+        self.driver_manager = DriverManager(driver_factory)
+        self.session = None
+
+    def get_driver(self):
+        """WebDriver가 필요할 때만 생성 (HTTP 경로에서는 폴백 시에만 사용)"""
+        return self.driver_manager.get_driver()
+
+    def check_health(self):
+        """실행 전 WebDriver 상태 확인 (응답 없음/메모리 상한 초과 시 재시작)"""
+        self.driver_manager.check_health()
+
+    def get_session(self):
+        """HTTP 세션 (커넥션 풀) 재사용"""
+        if not self.session:
+            self.session = createHttpSession()
+        return self.session
+
+    def get_news_urls(self, mediaId, since_aid=None):
+        """HTTP 경로로 기사 목록을 먼저 시도하고, 실패 시 Selenium으로 폴백"""
+        if settings.crawl_backend == "http":
+            try:
+                return fetchNewsUrlByMediaId(self.get_session(), mediaId, since_aid)
+            except Exception as e:
+                logger.warning(f"[Crawl] HTTP 목록 조회 실패, Selenium으로 재시도: oid={mediaId}, 오류={e}")
+        return self.driver_manager.run(lambda driver: getNewsUrlByMediaId(driver, mediaId, since_aid))
+
+    def get_news(self, url):
+        """HTTP 경로로 기사 상세를 먼저 시도하고, 실패 시 Selenium으로 폴백"""
+        if settings.crawl_backend == "http":
+            details = fetchNews(self.get_session(), url)
+            if details:
+                return details
+            logger.debug(f"[Crawl] HTTP 상세 추출 실패, Selenium으로 재시도: {url}")
+        return self.driver_manager.run(lambda driver: getNews(driver, url))
+
+    def close(self):
+        self.driver_manager.close()
+        if self.session:
+            self.session.close()
+            self.session = None
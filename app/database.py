@@ -1,11 +1,14 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, UpdateOne, ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from pymongo.database import Database
 from pymongo.collection import Collection
 from config import settings
+from news_url import normalizeNewsUrl
 from logger import get_logger
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timedelta
+import hashlib
 
 logger = get_logger()
 
@@ -25,6 +28,12 @@ class MongoDB:
         self.client: Optional[MongoClient] = None
         self.database: Optional[Database] = None
         self.collection: Optional[Collection] = None
+        self.articles: Optional[Collection] = None
+        self.crawl_state: Optional[Collection] = None
+        self.llm_cache: Optional[Collection] = None
+        self.locks: Optional[Collection] = None
+        self.triggers: Optional[Collection] = None
+        self._summary_listeners: List[Callable[[Optional[str]], None]] = []
         
     def connect(self):
         try:
@@ -35,11 +44,44 @@ class MongoDB:
             
             self.database = self.client[settings.mongodb_database]
             self.collection = self.database[settings.mongodb_collection]
+            self.articles = self.database[settings.mongodb_articles_collection]
+            self.crawl_state = self.database[settings.mongodb_crawl_state_collection]
+            self.llm_cache = self.database[settings.mongodb_llm_cache_collection]
+            self.locks = self.database[settings.mongodb_lock_collection]
+            self.triggers = self.database[settings.mongodb_trigger_collection]
+            self._ensure_indexes()
             
         except Exception as e:
             logger.error(f"MongoDB 연결 실패: {e}")
             raise Exception(f"MongoDB 연결에 실패했습니다: {str(e)}")
     
+    def _ensure_indexes(self):
+        """컬렉션 인덱스 생성 (이미 있으면 무시)"""
+        # 요약 이력: 조회/페이지 이동은 모두 _id 기준이므로 예전에 만든 created_at 인덱스는 제거
+        if "created_at_desc" in self.collection.index_information():
+            self.collection.drop_index("created_at_desc")
+        # 기사 원문: 정규화된 URL 기준 유일 (upsert 키)
+        self.articles.create_index([("url", ASCENDING)], name="url_unique", unique=True)
+        # 수동 실행 요청: 대기 중인 요청을 오래된 순으로 조회, 처리 이력은 7일 뒤 만료
+        self.triggers.create_index([("status", ASCENDING), ("requested_at", ASCENDING)], name="status_requested_at")
+        self.triggers.create_index([("requested_at", ASCENDING)], name="requested_at_ttl", expireAfterSeconds=7 * 24 * 3600)
+        # LLM 응답 캐시: created_at 기준 TTL 만료
+        self._ensure_ttl_index(self.llm_cache, "created_at", "created_at_ttl", int(settings.llm_cache_ttl * 3600))
+    
+    def _ensure_ttl_index(self, collection: Collection, field: str, name: str, expire_after_seconds: int):
+        """TTL 인덱스 생성 (만료 시간 설정이 바뀌어 기존 인덱스와 옵션이 충돌하면 collMod로 갱신)"""
+        try:
+            collection.create_index([(field, ASCENDING)], name=name, expireAfterSeconds=expire_after_seconds)
+        except OperationFailure as e:
+            if e.code != 85:  # IndexOptionsConflict
+                raise
+            self.database.command(
+                "collMod",
+                collection.name,
+                index={"name": name, "expireAfterSeconds": expire_after_seconds}
+            )
+            logger.info(f"TTL 인덱스 만료 시간 변경: {collection.name}.{name} -> {expire_after_seconds}초")
+    
     def disconnect(self):
         if self.client:
             self.client.close()
@@ -51,21 +93,48 @@ class MongoDB:
         return self.collection
     
     
-    def insert_summary_items(self, summary_items: list):
-        """NewsSummaryItem 목록을 MongoDB에 저장"""
+    def add_summary_listener(self, callback: Callable[[Optional[str]], None]):
+        """요약 데이터가 저장/삭제될 때 호출할 콜백 등록 (예: API 캐시 무효화)"""
+        self._summary_listeners.append(callback)
+    
+    def notify_summary_changed(self, summary_id: Optional[str] = None):
+        for callback in self._summary_listeners:
+            try:
+                callback(summary_id)
+            except Exception as e:
+                logger.error(f"요약 변경 알림 처리 실패: {e}")
+    
+    def insert_summary_items(self, 
+                             summary_items: list, 
+                             article_hashes: Optional[List[str]] = None,
+                             article_ids: Optional[Dict[str, ObjectId]] = None):
+        """NewsSummaryItem 목록을 MongoDB에 저장 (요약 대상 기사 집합 지문, 기사 ID 참조 포함)
+        
+        article_ids는 upsert_articles()가 반환한 정규화 URL -> 기사 _id 매핑이며,
+        각 요약 항목의 reference_url을 reference_article_ids로 함께 저장한다.
+        """
         try:
             if self.collection is None:
                 raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
             
+            article_ids = article_ids or {}
+            for item in summary_items:
+                references = [article_ids.get(normalizeNewsUrl(url)) for url in item.get("reference_url") or []]
+                item["reference_article_ids"] = [article_id for article_id in references if article_id is not None]
+            
             # 저장할 데이터 구성
             data_to_insert = {
                 "summary_items": summary_items,
                 "created_at": datetime.now().isoformat(),
-                "item_count": len(summary_items)
+                "item_count": len(summary_items),
+                "article_ids": list(article_ids.values()),
+                "article_hashes": article_hashes or [],
+                "fingerprint": hashlib.sha256("".join(article_hashes or []).encode("utf-8")).hexdigest()
             }
             
             result = self.collection.insert_one(data_to_insert)
             logger.info(f"NewsSummaryItem 목록 저장 완료: {result}")
+            self.notify_summary_changed(str(result.inserted_id))
             return str(result.inserted_id)
         except Exception as e:
             logger.error(f"NewsSummaryItem 목록 저장 실패: {e}")
@@ -107,5 +176,218 @@ class MongoDB:
         except Exception as e:
             logger.error(f"NewsSummaryItem 조회 실패: {e}")
             raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+    
+    def get_recent_summary_id(self) -> Optional[str]:
+        """가장 최근 요약의 _id만 조회 (캐시 버전 확인용)"""
+        try:
+            if self.collection is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = self.collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+            return str(result["_id"]) if result else None
+        except Exception as e:
+            logger.error(f"최근 요약 ID 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+    
+    def get_recent_article_hashes(self) -> Optional[Dict[str, Any]]:
+        """가장 최근 요약의 기사 집합 지문만 조회"""
+        try:
+            if self.collection is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = self.collection.find_one({}, {"article_hashes": 1}, sort=[("_id", -1)])
+            if result:
+                return convert_objectid_to_str(result)
+            return None
+        except Exception as e:
+            logger.error(f"요약 지문 조회 실패: {e}")
+            raise Exception(f"데이터 조회에 실패했습니다: {str(e)}")
+    
+    def upsert_articles(self, news_list: List[Dict[str, Any]]) -> Dict[str, ObjectId]:
+        """수집한 기사를 정규화된 URL 기준으로 일괄 upsert 하고 URL -> 기사 _id 매핑 반환
+        
+        같은 기사를 다시 수집해도 문서가 늘어나지 않으며, 본문이 바뀐 경우에만 갱신 시각이 바뀐다.
+        """
+        try:
+            if self.articles is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            
+            now = datetime.now()
+            operations = {}
+            for news in news_list:
+                if not news.get("url"):
+                    continue
+                url = normalizeNewsUrl(news["url"])
+                content = news.get("content") or ""
+                content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                operations[url] = UpdateOne(
+                    {"url": url},
+                    # 파이프라인 업데이트에서는 "$"로 시작하는 문자열이 필드 경로로 해석되므로
+                    # 수집한 문자열 값은 $literal로 감싸 그대로 저장
+                    [{"$set": {
+                        "url": {"$literal": url},
+                        "press": {"$literal": news.get("press")},
+                        "title": {"$literal": news.get("title")},
+                        "content": {"$literal": content},
+                        "content_hash": content_hash,
+                        "first_seen_at": {"$ifNull": ["$first_seen_at", now]},
+                        "updated_at": {"$cond": [{"$eq": ["$content_hash", content_hash]}, "$updated_at", now]},
+                        "last_seen_at": now
+                    }}],
+                    upsert=True
+                )
+            if not operations:
+                return {}
+            
+            result = self.articles.bulk_write(list(operations.values()), ordered=False)
+            logger.info(f"기사 원문 저장 완료: 신규 {result.upserted_count}개, 기존 {result.matched_count}개")
+            
+            cursor = self.articles.find({"url": {"$in": list(operations)}}, {"_id": 1, "url": 1})
+            return {doc["url"]: doc["_id"] for doc in cursor}
+        except Exception as e:
+            logger.error(f"기사 원문 저장 실패: {e}")
+            raise Exception(f"기사 원문 저장에 실패했습니다: {str(e)}")
+    
+    def get_cached_articles(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """정규화된 URL 목록으로 최근 ARTICLE_CACHE_TTL시간 안에 목록에서 본 기사 조회 (크롤러 재수집 생략용)"""
+        try:
+            if self.articles is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            fresh_after = datetime.now() - timedelta(hours=settings.article_cache_ttl)
+            cursor = self.articles.find(
+                {"url": {"$in": urls}, "last_seen_at": {"$gte": fresh_after}},
+                {"_id": 0, "url": 1, "title": 1, "content": 1}
+            )
+            return {doc["url"]: doc for doc in cursor}
+        except Exception as e:
+            logger.error(f"기사 캐시 조회 실패: {e}")
+            raise Exception(f"기사 캐시 조회에 실패했습니다: {str(e)}")
+
+    def get_crawl_state(self, media_id: str) -> Optional[Dict[str, Any]]:
+        """언론사(oid)별 마지막 크롤링 상태 (high-water mark) 조회"""
+        try:
+            if self.crawl_state is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            return self.crawl_state.find_one({"_id": media_id})
+        except Exception as e:
+            logger.error(f"크롤링 상태 조회 실패: {e}")
+            raise Exception(f"크롤링 상태 조회에 실패했습니다: {str(e)}")
+    
+    def save_crawl_state(self, media_id: str, last_aid: Optional[int], recent_urls: List[str]):
+        """언론사(oid)별 가장 최신 기사 번호와 최근 수집 URL 저장 (기사 번호는 줄어들지 않음)"""
+        try:
+            if self.crawl_state is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            update = {"$set": {"recent_urls": recent_urls, "updated_at": datetime.now()}}
+            if last_aid is not None:
+                update["$max"] = {"last_aid": last_aid}
+            self.crawl_state.update_one({"_id": media_id}, update, upsert=True)
+        except Exception as e:
+            logger.error(f"크롤링 상태 저장 실패: {e}")
+            raise Exception(f"크롤링 상태 저장에 실패했습니다: {str(e)}")
+
+    def acquire_lock(self, name: str, owner: str, lease_seconds: int) -> bool:
+        """리스 기반 락 획득 (비어 있거나 만료됐거나 이미 내 락이면 성공)
+        
+        만료 판단과 만료 시각 계산은 프로세스 간 시계 차이가 없도록 MongoDB 서버 시각($$NOW) 기준이다.
+        upsert 조회 조건에는 $expr를 쓸 수 없으므로 기존 락 인계(upsert 없음)와 새 락 생성(upsert)을 나눠 처리한다.
+        """
+        try:
+            if self.locks is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            lease = [{"$set": {
+                "owner": {"$literal": owner},
+                "acquired_at": {"$cond": [{"$eq": ["$owner", {"$literal": owner}]}, "$acquired_at", "$$NOW"]},
+                "expires_at": {"$add": ["$$NOW", lease_seconds * 1000]}
+            }}]
+            # 1. 내 락이거나 만료된 락이면 인계
+            result = self.locks.update_one(
+                {
+                    "_id": name,
+                    "$or": [
+                        {"owner": owner},
+                        {"$expr": {"$lt": ["$expires_at", "$$NOW"]}}
+                    ]
+                },
+                lease
+            )
+            if result.matched_count:
+                return True
+            # 2. 락 문서가 없으면 생성 (유효한 락이 있으면 _id 충돌)
+            self.locks.update_one({"_id": name, "owner": {"$exists": False}}, lease, upsert=True)
+            return True
+        except DuplicateKeyError:
+            # 다른 프로세스가 유효한 락을 보유 중 (upsert가 기존 _id와 충돌)
+            return False
+        except Exception as e:
+            logger.error(f"락 획득 실패: {e}")
+            raise Exception(f"락 획득에 실패했습니다: {str(e)}")
+    
+    def renew_lock(self, name: str, owner: str, lease_seconds: int) -> bool:
+        """보유 중인 락의 리스 연장 (다른 프로세스에 넘어갔으면 False)"""
+        try:
+            if self.locks is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = self.locks.update_one(
+                {"_id": name, "owner": owner},
+                [{"$set": {"expires_at": {"$add": ["$$NOW", lease_seconds * 1000]}}}]
+            )
+            return result.matched_count > 0
+        except Exception as e:
+            logger.error(f"락 갱신 실패: {e}")
+            raise Exception(f"락 갱신에 실패했습니다: {str(e)}")
+    
+    def release_lock(self, name: str, owner: str):
+        """보유 중인 락 해제 (다른 프로세스의 락은 건드리지 않음)"""
+        try:
+            if self.locks is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            self.locks.delete_one({"_id": name, "owner": owner})
+        except Exception as e:
+            logger.error(f"락 해제 실패: {e}")
+            raise Exception(f"락 해제에 실패했습니다: {str(e)}")
+
+    def insert_crawl_trigger(self, source: str) -> str:
+        """수동 크롤링 실행 요청 등록 (이미 대기 중인 요청이 있으면 그 요청 ID 반환)"""
+        try:
+            if self.triggers is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = self.triggers.find_one_and_update(
+                {"status": "pending"},
+                {"$setOnInsert": {"status": "pending", "source": source, "requested_at": datetime.now()}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return str(result["_id"])
+        except Exception as e:
+            logger.error(f"수동 실행 요청 저장 실패: {e}")
+            raise Exception(f"수동 실행 요청 저장에 실패했습니다: {str(e)}")
+    
+    def claim_crawl_trigger(self, owner: str) -> Optional[Dict[str, Any]]:
+        """대기 중인 수동 실행 요청 중 가장 오래된 것을 가져와 실행 중으로 표시"""
+        try:
+            if self.triggers is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            result = self.triggers.find_one_and_update(
+                {"status": "pending"},
+                {"$set": {"status": "running", "claimed_by": owner, "claimed_at": datetime.now()}},
+                sort=[("requested_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER
+            )
+            return convert_objectid_to_str(result) if result else None
+        except Exception as e:
+            logger.error(f"수동 실행 요청 조회 실패: {e}")
+            raise Exception(f"수동 실행 요청 조회에 실패했습니다: {str(e)}")
+    
+    def complete_crawl_trigger(self, trigger_id: str, status: str):
+        """수동 실행 요청 처리 결과 기록 (done | skipped)"""
+        try:
+            if self.triggers is None:
+                raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+            self.triggers.update_one(
+                {"_id": ObjectId(trigger_id)},
+                {"$set": {"status": status, "finished_at": datetime.now()}}
+            )
+        except Exception as e:
+            logger.error(f"수동 실행 요청 완료 기록 실패: {e}")
+            raise Exception(f"수동 실행 요청 완료 기록에 실패했습니다: {str(e)}")
 
 mongodb = MongoDB() 
\ No newline at end of file
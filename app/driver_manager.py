@@ -0,0 +1,154 @@
+import threading
+from typing import Callable
+
+import psutil
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+
+from config import settings
+from logger import get_logger
+from metrics import metrics
+
+logger = get_logger()
+
+# 드라이버를 다시 만들어야 하는 WebDriver 오류 메시지 (브라우저 크래시/세션 유실)
+SESSION_ERROR_MESSAGES = (
+    "invalid session id",
+    "session deleted",
+    "chrome not reachable",
+    "tab crashed",
+    "disconnected",
+    "target window already closed",
+    "no such window",
+)
+
+def isSessionError(error: Exception) -> bool:
+    """브라우저 크래시/세션 유실처럼 드라이버를 새로 만들어야 하는 오류인지 확인"""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    if isinstance(error, WebDriverException):
+        message = str(error).lower()
+        return any(text in message for text in SESSION_ERROR_MESSAGES)
+    return False
+
+def processTreeRss(pid: int) -> int:
+    """chromedriver와 그 하위 Chromium 프로세스 전체의 RSS (바이트)"""
+    try:
+        process = psutil.Process(pid)
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    except psutil.Error:
+        return 0
+
+class DriverManager:
+    """WebDriver 수명 관리 (사용 전 상태 확인, N페이지/메모리 상한 초과 시 재시작, 세션 오류 시 복구)
+
+    오래 쓴 headless Chromium은 페이지를 열수록 메모리가 늘어나므로, 일정 페이지 수마다 또는
+    프로세스 트리 RSS가 상한을 넘으면 드라이버를 새로 만든다.
+    """
+    RSS_CHECK_EVERY = 10  # 페이지 수 기준 RSS 확인 주기
+
+    def __init__(self, driver_factory: Callable):
+        self.driver_factory = driver_factory
+        self.driver = None
+        self.pages = 0
+        self._lock = threading.Lock()
+
+    def _quit(self):
+        if self.driver:
+            try:
+                self.driver.quit()
+                logger.info("Chrome WebDriver 정리 완료")
+            except Exception as e:
+                logger.error(f"WebDriver 정리 실패: {e}")
+            finally:
+                self.driver = None
+
+    def _start(self):
+        self.driver = self.driver_factory()
+        self.pages = 0
+        metrics.incr("browser.driver.started")
+
+    def restart(self, reason: str):
+        """드라이버 재시작 (재시작 사유별로 메트릭 기록)"""
+        logger.warning(f"[Driver] WebDriver 재시작: {reason} (사용 페이지 {self.pages}개)")
+        metrics.incr("browser.driver.restarts")
+        metrics.incr(f"browser.driver.restarts.{reason}")
+        self._quit()
+        self._start()
+
+    def rss_bytes(self) -> int:
+        """현재 드라이버 프로세스 트리의 RSS (바이트, 측정 불가 시 0)"""
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return 0
+        rss = processTreeRss(process.pid)
+        metrics.gauge("browser.driver.rss_mb", round(rss / 1024 / 1024, 1))
+        return rss
+
+    def is_healthy(self) -> bool:
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception as e:
+            logger.warning(f"[Driver] WebDriver 상태 확인 실패: {e}")
+            return False
+
+    def check_health(self):
+        """크롤링 실행 전 상태 확인 (응답이 없거나 메모리 상한 초과 시 재시작)"""
+        with self._lock:
+            if not self.driver:
+                return
+            if not self.is_healthy():
+                self.restart("unhealthy")
+            elif self._over_memory_limit():
+                self.restart("memory")
+
+    def _over_memory_limit(self) -> bool:
+        if settings.driver_max_rss_mb <= 0:
+            return False
+        rss_mb = self.rss_bytes() / 1024 / 1024
+        if rss_mb > settings.driver_max_rss_mb:
+            logger.warning(f"[Driver] WebDriver 메모리 {rss_mb:.0f}MB가 상한 {settings.driver_max_rss_mb}MB를 넘었습니다")
+            return True
+        return False
+
+    def get_driver(self):
+        """WebDriver가 필요할 때만 생성하고, 페이지 수/메모리 상한을 넘었으면 새로 만들어 반환"""
+        with self._lock:
+            if not self.driver:
+                self._start()
+            elif settings.driver_max_pages > 0 and self.pages >= settings.driver_max_pages:
+                self.restart("pages")
+            elif self.pages and self.pages % self.RSS_CHECK_EVERY == 0 and self._over_memory_limit():
+                self.restart("memory")
+            return self.driver
+
+    def run(self, action: Callable):
+        """action(driver) 실행, 세션 오류(브라우저 크래시 등)면 드라이버를 재시작하고 한 번 재시도"""
+        for attempt in range(2):
+            driver = self.get_driver()
+            self.pages += 1
+            try:
+                result = action(driver)
+            except Exception as e:
+                if attempt or not isSessionError(e):
+                    raise
+            else:
+                # 추출 함수가 오류를 삼키고 None을 반환한 경우에도 브라우저가 죽었는지 확인
+                if result is not None or attempt or self.is_healthy():
+                    return result
+            metrics.incr("browser.driver.session_errors")
+            with self._lock:
+                self.restart("session_error")
+        return None
+
+    def close(self):
+        with self._lock:
+            self._quit()
+            self.pages = 0
@@ -0,0 +1,95 @@
+import os
+import socket
+import threading
+import uuid
+from typing import Optional
+
+from config import settings
+from database import mongodb
+from logger import get_logger
+from metrics import metrics
+
+logger = get_logger()
+
+class LeaderLock:
+    """MongoDB 리스 락으로 여러 프로세스 중 리더 하나만 선출
+
+    리더는 heartbeat 스레드로 리스를 주기적으로 연장하며, 리더 프로세스가 죽어 갱신이 끊기면
+    리스 만료 후 다른 프로세스의 try_acquire()가 성공하여 리더를 인계받는다.
+    """
+    def __init__(self, name: str, lease_seconds: int, heartbeat_seconds: int):
+        self.name = name
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = max(1, min(heartbeat_seconds, lease_seconds // 2 or 1))
+        self._is_leader = False
+        self._stop_event = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def try_acquire(self) -> bool:
+        """리더 락 획득 시도 (이미 리더면 리스만 연장)"""
+        try:
+            acquired = mongodb.acquire_lock(self.name, self.owner, self.lease_seconds)
+        except Exception as e:
+            logger.warning(f"[Leader] 리더 락 확인 실패: {e}")
+            acquired = False
+
+        with self._lock:
+            was_leader = self._is_leader
+            self._is_leader = acquired
+        if acquired and not was_leader:
+            metrics.incr("scheduler.leader.acquired")
+            logger.info(f"[Leader] 리더 획득: {self.name} ({self.owner})")
+            self._start_heartbeat()
+        elif was_leader and not acquired:
+            metrics.incr("scheduler.leader.lost")
+            logger.warning(f"[Leader] 리더 상실: {self.name} ({self.owner})")
+        return acquired
+
+    def _start_heartbeat(self):
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, name=f"leader-{self.name}", daemon=True)
+        self._heartbeat_thread.start()
+
+    def _heartbeat(self):
+        while not self._stop_event.wait(self.heartbeat_seconds):
+            try:
+                renewed = mongodb.renew_lock(self.name, self.owner, self.lease_seconds)
+            except Exception as e:
+                # 일시적 오류는 리스가 남아 있는 동안 다음 주기에 재시도
+                logger.warning(f"[Leader] 리스 갱신 실패: {e}")
+                continue
+            if not renewed:
+                with self._lock:
+                    self._is_leader = False
+                metrics.incr("scheduler.leader.lost")
+                logger.warning(f"[Leader] 리스가 다른 프로세스로 넘어가 리더를 상실했습니다: {self.name}")
+                return
+
+    def release(self):
+        """heartbeat 중지 및 락 해제 (대기 중인 프로세스가 리스 만료를 기다리지 않고 인계)"""
+        self._stop_event.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join(timeout=5)
+        with self._lock:
+            was_leader = self._is_leader
+            self._is_leader = False
+        if was_leader:
+            try:
+                mongodb.release_lock(self.name, self.owner)
+                logger.info(f"[Leader] 리더 락 해제: {self.name}")
+            except Exception as e:
+                logger.warning(f"[Leader] 리더 락 해제 실패 (리스 만료 후 인계됨): {e}")
+
+def create_scheduler_lock() -> Optional[LeaderLock]:
+    """설정에 따라 스케줄러 리더 락 생성 (비활성화 시 None)"""
+    if not settings.scheduler_lock_enabled:
+        return None
+    return LeaderLock("news_scheduler", settings.scheduler_lock_lease, settings.scheduler_lock_heartbeat)
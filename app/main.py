@@ -1,12 +1,17 @@
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from summary.services import NewsSummaryService
+from fastapi.responses import FileResponse, Response
 from database import mongodb
+from async_database import async_mongodb, HISTORY_PROJECTIONS
+from bson import ObjectId
+from typing import Optional
+from summary_cache import latest_summary_cache
 from logger import get_logger
 from config import settings
+import asyncio
 import os
+import secrets
 import threading
 
 # 로거 설정 (uvicorn 로거도 포함)
@@ -28,19 +33,13 @@ static_assets_dir = os.path.join(build_dir, "static")
 
 app.mount("/static", StaticFiles(directory=static_assets_dir), name="static")
 
-news_service = None
-
-def get_news_service() -> NewsSummaryService:
-    global news_service
-    if news_service is None:
-        try:
-            news_service = NewsSummaryService()
-        except ValueError as e:
-            raise HTTPException(status_code=500, detail=str(e))
-    return news_service
+# 내장 스케줄러 (SCHEDULE_ENABLED=true일 때만 생성)
+scheduler = None
+scheduler_thread: Optional[threading.Thread] = None
 
 def init_schedule():
-    """백그라운드에서 스케줄러 실행"""
+    """백그라운드에서 스케줄러 실행 (selenium/Gemini 의존성은 이때만 import)"""
+    global scheduler
     try:
         from scheduler import NewsScheduler
         
@@ -49,20 +48,32 @@ def init_schedule():
         scheduler.start_scheduler(settings.schedule_interval)
     except Exception as e:
         logger.error(f"스케줄러 시작 중 오류: {e}")
-        if 'scheduler' in locals():
+        if scheduler is not None:
             scheduler.stop_scheduler()
 
+async def stop_schedule(timeout: float = 10):
+    """내장 스케줄러 종료 및 리더 락 해제 (대기 중인 워커가 리스 만료를 기다리지 않고 인계)
+    
+    scheduler.main()의 SIGTERM 처리처럼 루프에 종료를 요청하고, 실행 중인 작업이 timeout초 안에
+    끝나지 않으면 스케줄러를 바로 중지한다 (리더를 상실한 작업은 요약을 저장하지 않음).
+    """
+    if scheduler is None or scheduler_thread is None:
+        return
+    scheduler.request_stop()
+    await asyncio.to_thread(scheduler_thread.join, timeout)
+    if scheduler_thread.is_alive():
+        logger.warning(f"스케줄러 작업이 {timeout}초 안에 끝나지 않아 바로 중지합니다")
+        scheduler.stop_scheduler()
+
 @app.on_event("startup")
 async def startup_event():
+    global scheduler_thread
     try:
         mongodb.connect()
+        await async_mongodb.connect()
+        await latest_summary_cache.start()
         
-        # 뉴스 서비스 초기화
-        service = get_news_service()
-        if not service.validate_api_key():
-            logger.warning("Google API 키가 유효하지 않습니다. .env 파일을 확인해주세요.")
-        
-        # 스케줄러를 백그라운드 스레드로 시작
+        # 스케줄러를 백그라운드 스레드로 시작 (별도 워커 프로세스를 쓰면 SCHEDULE_ENABLED=false)
         if settings.schedule_enabled:
             scheduler_thread = threading.Thread(target=init_schedule, daemon=True)
             scheduler_thread.start()
@@ -74,6 +85,9 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await stop_schedule()
+    await latest_summary_cache.stop()
+    await async_mongodb.disconnect()
     mongodb.disconnect()
     logger.info("server shutdown..")
 
@@ -82,20 +96,76 @@ def ping():
     return {"message": "pong"}
 
 @app.get("/api/data")
-def get_summary():
-    response = mongodb.get_recent_summary_item()
+async def get_summary(request: Request):
+    payload = await latest_summary_cache.get()
+    body, encoding = payload.select(request.headers.get("accept-encoding", ""))
     
-    if not response:
-        return {"summary_items": [], "created_at": None}
+    # no-cache: 브라우저가 매번 ETag로 재검증하여 변경이 없으면 304만 받음
+    headers = {
+        "ETag": payload.etag(encoding),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+    last_modified = payload.last_modified_header()
+    if last_modified:
+        headers["Last-Modified"] = last_modified
     
-    if 'data' in response:
-        summary_items = response.get('data', {}).get('summary_items', [])
-        created_at = response.get('data', {}).get('created_at')
-    else:
-        summary_items = response.get('summary_items', [])
-        created_at = response.get('created_at')
+    if payload.is_not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/api/history")
+async def get_summary_history(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    view: str = Query("titles", description="titles(주제 제목만) | full(전체 요약)")
+):
+    if view not in HISTORY_PROJECTIONS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 view입니다: {view}")
+    if cursor and not ObjectId.is_valid(cursor):
+        raise HTTPException(status_code=400, detail="cursor 형식이 올바르지 않습니다.")
+    return await async_mongodb.get_summary_history(limit, cursor, view)
+
+@app.get("/api/history/{summary_id}")
+async def get_summary_by_id(summary_id: str):
+    if not ObjectId.is_valid(summary_id):
+        raise HTTPException(status_code=400, detail="요약 ID 형식이 올바르지 않습니다.")
+    summary = await async_mongodb.get_summary_items_by_id(summary_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="요약 데이터를 찾을 수 없습니다.")
+    return summary
+
+@app.get("/api/articles")
+async def get_article_by_url(url: str = Query(..., description="요약 항목의 reference_url")):
+    article = await async_mongodb.get_article_by_url(url)
+    if not article:
+        raise HTTPException(status_code=404, detail="기사 데이터를 찾을 수 없습니다.")
+    return article
+
+@app.get("/api/articles/{article_id}")
+async def get_article_by_id(article_id: str):
+    if not ObjectId.is_valid(article_id):
+        raise HTTPException(status_code=400, detail="기사 ID 형식이 올바르지 않습니다.")
+    article = await async_mongodb.get_article_by_id(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="기사 데이터를 찾을 수 없습니다.")
+    return article
+
+@app.post("/api/crawl/trigger", status_code=202)
+async def trigger_crawl(x_trigger_token: Optional[str] = Header(None)):
+    """즉시 크롤링/요약 실행 요청 (리더 스케줄러가 SCHEDULE_TRIGGER_POLL초 안에 가져가 실행)
     
-    return {"summary_items": summary_items, "created_at": created_at}
+    SCHEDULE_TRIGGER_TOKEN이 설정된 경우에만 열리며, X-Trigger-Token 헤더가 일치해야 한다.
+    """
+    if not settings.schedule_trigger_token:
+        raise HTTPException(status_code=404, detail="API endpoint not found")
+    if not secrets.compare_digest(x_trigger_token or "", settings.schedule_trigger_token):
+        raise HTTPException(status_code=403, detail="실행 요청 권한이 없습니다.")
+    trigger_id = await async_mongodb.insert_crawl_trigger("api")
+    return {"trigger_id": trigger_id, "status": "pending"}
 
 @app.get("/{full_path:path}")
 async def serve_react_app(full_path: str, request: Request):
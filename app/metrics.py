@@ -0,0 +1,47 @@
+import threading
+from typing import Dict, Any
+
+class Metrics:
+    """카운터와 소요 시간(초)을 집계하는 스레드 안전 메트릭 저장소"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            timing = self._timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+
+    def gauge(self, name: str, value: float):
+        """마지막 측정값만 유지 (예: 현재 메모리 사용량)"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            timings = {
+                name: {
+                    "count": t["count"],
+                    "total": round(t["total"], 4),
+                    "avg": round(t["total"] / t["count"], 4) if t["count"] else 0.0,
+                    "max": round(t["max"], 4)
+                }
+                for name, t in self._timings.items()
+            }
+            return {"counters": dict(self._counters), "gauges": dict(self._gauges), "timings": timings}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+            self._gauges.clear()
+
+metrics = Metrics()
@@ -0,0 +1,32 @@
+import re
+from urllib.parse import urlparse, urlencode, parse_qsl
+
+# 기사 URL 해석 유틸리티 (크롤러와 API 양쪽에서 사용하므로 selenium 등 무거운 의존성 없음)
+
+def getArticleId(news_url):
+    """기사 URL에서 언론사 내 기사 번호(aid) 추출 (최신 기사일수록 큼)"""
+    match = re.search(r"/article/\d{3}/(\d+)", news_url) or re.search(r"[?&]aid=(\d+)", news_url)
+    return int(match.group(1)) if match else None
+
+def getOidFromUrl(news_url):
+    """기사 URL에서 언론사 ID(oid) 추출"""
+    match = re.search(r"/article/(\d{3})/\d+", news_url) or re.search(r"[?&]oid=(\d{3})", news_url)
+    return match.group(1) if match else None
+
+def normalizeNewsUrl(news_url):
+    """캐시 키용 URL 정규화 (네이버 기사는 oid/aid 기준의 정식 URL로 통일)"""
+    parsed = urlparse(news_url)
+    query = dict(parse_qsl(parsed.query))
+
+    match = re.search(r"/article/(\d{3})/(\d+)", parsed.path)
+    if match:
+        return f"https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}"
+    if "oid" in query and "aid" in query:
+        return f"https://n.news.naver.com/mnews/article/{query['oid']}/{query['aid']}"
+
+    return parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        query=urlencode(sorted(query.items())),
+        fragment=""
+    ).geturl()
@@ -1,23 +1,34 @@
-import schedule
+import random
+import threading
 import time
-from crawl import getNewsUrlByMediaId, getNews, mediaIdList
+from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from crawl import mediaIdList, CrawlWorker, applyLeanProfile, setupDriverNetwork
+from news_url import normalizeNewsUrl, getArticleId
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from anew_service import anew_service
+from leader_lock import create_scheduler_lock
 from database import mongodb
 from logger import get_logger
+from metrics import metrics
 from config import settings
 
 logger = get_logger()
 
 class NewsScheduler:
     def __init__(self):
-        self.driver = None
+        self.worker = CrawlWorker(self.create_driver)  # 순차 크롤링용 기본 워커
+        self.leader_lock = create_scheduler_lock()  # 여러 프로세스 중 리더만 크롤링
         self.is_running = False
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._job_lock = threading.Lock()  # 크롤링 겹침 방지
+        self._manual_trigger: Optional[str] = None
         
-    def setup_driver(self):
-        """Chrome WebDriver 설정"""
+    def create_driver(self):
+        """Chrome WebDriver 생성"""
         try:
             options = webdriver.ChromeOptions()
             options.binary_location = "/usr/bin/chromium"  # Debian에 설치된 chromium 경로
@@ -26,128 +37,383 @@ class NewsScheduler:
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
+            applyLeanProfile(options)
             # ChromeDriverManager가 경로 적용
-            self.driver = webdriver.Chrome(
+            driver = webdriver.Chrome(
                 service=Service("/usr/bin/chromedriver"),
                 options=options
             )
+            setupDriverNetwork(driver)
             logger.info("Chrome WebDriver 설정 완료")
+            return driver
 
         except Exception as e:
             logger.error(f"WebDriver 설정 실패: {e}")
             raise
-        except Exception as e:
-            logger.error(f"WebDriver 설정 실패: {e}")
-            raise
+    
+    def setup_driver(self):
+        """기본 워커의 Chrome WebDriver 설정"""
+        self.worker.get_driver()
     
     def cleanup_driver(self):
         """WebDriver 정리"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("Chrome WebDriver 정리 완료")
-            except Exception as e:
-                logger.error(f"WebDriver 정리 실패: {e}")
+        self.worker.close()
     
-    def crawl_news(self):
-        """뉴스 크롤링 수행"""
+    def get_news_urls(self, worker, mediaId):
+        """언론사 기사 URL 목록 조회 (증분 모드에서는 마지막으로 본 기사 이후만 새로 조회)"""
+        if not settings.crawl_incremental:
+            return worker.get_news_urls(mediaId)
+        
         try:
-            start_time = time.time()
-            logger.info(f"[Crawl] Start time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
-
-            
-            if not self.driver:
-                self.setup_driver()
-            
-            mediaIds = list(mediaIdList.keys())
-            newsData = {mediaIdList[mediaId]: [] for mediaId in mediaIds}
-            
-            # 언론사별 실패 카운트 초기화
-            fail_counts = {mediaIdList[mediaId]: 0 for mediaId in mediaIds}
+            state = mongodb.get_crawl_state(mediaId) or {}
+        except Exception as e:
+            logger.warning(f"[Crawl] 크롤링 상태 조회 실패, 전체 목록 조회: oid={mediaId}, {e}")
+            state = {}
+        
+        new_urls = worker.get_news_urls(mediaId, state.get("last_aid"))
+        # 새 기사 + 직전 실행의 기사로 수집 범위를 채움 (직전 기사는 기사 캐시에서 조회됨)
+        urls = list(dict.fromkeys(new_urls + state.get("recent_urls", [])))[:settings.max_news_by_media]
+        metrics.incr("crawl.incremental.new_urls", len(new_urls))
+        logger.info(f"[Crawl] oid={mediaId}: 새 기사 {len(new_urls)}개 (마지막 기사 번호: {state.get('last_aid')})")
+        return urls
+    
+    def save_crawl_state(self, mediaId, urls, collected):
+        """언론사 상세 수집이 끝난 뒤 크롤링 상태 저장 (증분 모드)
+        
+        마지막 기사 번호는 상세 수집에 성공한 기사 기준으로만 올리고, 수집 범위 전체는 recent_urls로
+        남겨 실패한 기사도 다음 실행에서 다시 시도한다. 수집한 기사가 없으면 상태를 바꾸지 않는다.
+        """
+        if not settings.crawl_incremental or not collected:
+            return
+        aids = [aid for aid in (getArticleId(news["url"]) for news in collected) if aid is not None]
+        try:
+            mongodb.save_crawl_state(mediaId, max(aids) if aids else None, urls)
+        except Exception as e:
+            logger.warning(f"[Crawl] 크롤링 상태 저장 실패: oid={mediaId}, {e}")
+    
+    def get_cached_news(self, urls):
+        """articles 컬렉션에서 최근에 수집한 기사 조회 (조회 오류는 크롤링을 막지 않음)"""
+        if not settings.article_cache_enabled or not urls:
+            return {}
+        try:
+            cached = mongodb.get_cached_articles([normalizeNewsUrl(url) for url in urls])
+        except Exception as e:
+            logger.warning(f"[Crawl] 기사 캐시 조회 실패, 전체 수집으로 진행: {e}")
+            return {}
+        
+        result = {}
+        for url in urls:
+            doc = cached.get(normalizeNewsUrl(url))
+            if doc:
+                result[url] = {"title": doc["title"], "content": doc["content"]}
+        metrics.incr("crawl.article_cache.hit", len(result))
+        metrics.incr("crawl.article_cache.miss", len(urls) - len(result))
+        return result
+    
+    def collect_news(self, mediaIds):
+        """언론사별로 순차 수집"""
+        newsData = {mediaIdList[mediaId]: [] for mediaId in mediaIds}
+        
+        # 언론사별 실패 카운트 초기화
+        fail_counts = {mediaIdList[mediaId]: 0 for mediaId in mediaIds}
+        
+        for mediaId in mediaIds:
+            mediaName = mediaIdList[mediaId]
+            collected = newsData[mediaName]
             
-            for mediaId in mediaIds:
-                mediaName = mediaIdList[mediaId]
-                collected = newsData[mediaName]
+            try:
+                urls = self.get_news_urls(self.worker, mediaId)
+                cached = self.get_cached_news(urls)
                 
-                try:
-                    urls = getNewsUrlByMediaId(self.driver, mediaId)
+                for url in urls:
+                    if len(collected) >= settings.max_news_by_media:
+                        break
+                    if any(d['url'] == url for d in collected):
+                        continue
                     
+                    details = cached.get(url) or self.worker.get_news(url)
+                    if details:
+                        collected.append({
+                            "press": mediaName,
+                            "url": url,
+                            **details
+                        })
+                    else:
+                        fail_counts[mediaName] += 1
+                        logger.warning(f"[Crawl] '{mediaName}' 상세페이지 추출 실패: {url}")
+                
+                logger.info(f"[Crawl] {mediaName}: {len(collected)}개 뉴스 수집 완료 (실패 {fail_counts[mediaName]}개)")
+                self.save_crawl_state(mediaId, urls, collected)
+                
+            except Exception as e:
+                logger.error(f"[Crawl] {mediaName} 크롤링 중 오류: {e}")
+                continue
+        
+        return newsData
+    
+    def _upsert_articles(self, batch, article_ids):
+        """수집한 기사를 articles 컬렉션에 일괄 저장 (실패 시 해당 기사는 요약에서 참조 없이 진행)"""
+        if not batch:
+            return
+        try:
+            article_ids.update(mongodb.upsert_articles(batch))
+        except Exception as e:
+            metrics.incr("crawl.article_upsert_errors")
+            logger.warning(f"[Crawl] 기사 {len(batch)}개 저장 실패, 요약에서 기사 참조 없이 진행합니다: {e}")
+    
+    def collect_news_concurrently(self, mediaIds):
+        """워커 풀로 언론사 목록/기사 상세를 동시에 수집 (워커마다 별도 세션/드라이버)
+        
+        수집된 기사는 워커가 나머지 기사를 가져오는 동안 CRAWL_UPSERT_BATCH개씩 articles에 저장하며,
+        (언론사별 기사 목록, URL -> 기사 _id)를 반환한다.
+        """
+        newsData = {mediaIdList[mediaId]: [] for mediaId in mediaIds}
+        fail_counts = {mediaIdList[mediaId]: 0 for mediaId in mediaIds}
+        article_ids = {}
+        unsaved = []
+        
+        local = threading.local()
+        workers = []
+        workers_lock = threading.Lock()
+        
+        def current_worker():
+            worker = getattr(local, "worker", None)
+            if worker is None:
+                worker = CrawlWorker(self.create_driver)
+                local.worker = worker
+                with workers_lock:
+                    workers.append(worker)
+            return worker
+        
+        def fetch_urls(mediaId):
+            return self.get_news_urls(current_worker(), mediaId)
+        
+        def fetch_news(mediaName, url):
+            return current_worker().get_news(url)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=settings.crawl_workers, thread_name_prefix="crawl") as executor:
+                url_futures = {executor.submit(fetch_urls, mediaId): mediaId for mediaId in mediaIds}
+                
+                # 목록이 준비된 언론사부터 상세 페이지 작업을 바로 투입
+                news_futures = {mediaIdList[mediaId]: [] for mediaId in mediaIds}
+                for future in as_completed(url_futures):
+                    mediaName = mediaIdList[url_futures[future]]
+                    try:
+                        urls = list(dict.fromkeys(future.result()))[:settings.max_news_by_media]
+                    except Exception as e:
+                        logger.error(f"[Crawl] {mediaName} 크롤링 중 오류: {e}")
+                        continue
+                    cached = self.get_cached_news(urls)
                     for url in urls:
-                        if len(collected) >= settings.max_news_by_media:
-                            break
-                        if any(d['url'] == url for d in collected):
-                            continue
-                        
-                        details = getNews(self.driver, url)
+                        if url in cached:
+                            news_futures[mediaName].append((url, cached[url]))
+                        else:
+                            news_futures[mediaName].append((url, executor.submit(fetch_news, mediaName, url)))
+                
+                # 목록 순서를 유지하며 결과 병합
+                for mediaId in mediaIds:
+                    mediaName = mediaIdList[mediaId]
+                    futures = news_futures[mediaName]
+                    collected = newsData[mediaName]
+                    for url, pending in futures:
+                        try:
+                            details = pending if isinstance(pending, dict) else pending.result()
+                        except Exception as e:
+                            logger.error(f"[Crawl] '{mediaName}' 상세페이지 처리 중 오류: {url}, {e}")
+                            details = None
                         if details:
-                            collected.append({
+                            news = {
                                 "press": mediaName,
                                 "url": url,
                                 **details
-                            })
+                            }
+                            collected.append(news)
+                            unsaved.append(news)
                         else:
                             fail_counts[mediaName] += 1
                             logger.warning(f"[Crawl] '{mediaName}' 상세페이지 추출 실패: {url}")
-                    
-                    logger.info(f"[Crawl] {mediaName}: {len(collected)}개 뉴스 수집 완료")
-                    
-                except Exception as e:
-                    logger.error(f"[Crawl] {mediaName} 크롤링 중 오류: {e}")
-                    continue
+                        if len(unsaved) >= max(1, settings.crawl_upsert_batch):
+                            self._upsert_articles(unsaved, article_ids)
+                            unsaved = []
+                    if futures:
+                        logger.info(f"[Crawl] {mediaName}: {len(collected)}개 뉴스 수집 완료 (실패 {fail_counts[mediaName]}개)")
+                        self.save_crawl_state(mediaId, [url for url, _ in futures], collected)
+                self._upsert_articles(unsaved, article_ids)
+        finally:
+            for worker in workers:
+                worker.close()
+        
+        return newsData, article_ids
+    
+    def acquire_leadership(self):
+        """리더 락 획득/연장 (락 비활성화 시 항상 리더)"""
+        if self.leader_lock is None:
+            return True
+        return self.leader_lock.try_acquire()
+    
+    def summarize_news(self, all_news, article_ids=None):
+        """수집된 뉴스 요약 및 저장 (article_ids: 수집 중 이미 저장한 기사의 URL -> _id)"""
+        if self.leader_lock is not None and not self.leader_lock.is_leader:
+            # 수집 중 리스를 잃었으면 새 리더와 중복 요약하지 않음
+            logger.warning("[Crawl] 수집 중 리더를 상실하여 요약을 건너뜁니다")
+            return
+        if not all_news:
+            logger.warning("[Crawl] 수집된 뉴스가 없습니다")
+            return
+        
+        logger.info(f"[Crawl] 총 {len(all_news)}개 뉴스 수집 완료")
+        try:
+            anew_service.process_and_save_summary(all_news, article_ids=article_ids)
+            logger.info("[Crawl] 뉴스 요약 및 저장 완료")
+        except Exception as e:
+            logger.error(f"[Crawl] 뉴스 요약 및 저장 실패: {e}")
+    
+    def crawl_news(self):
+        """뉴스 크롤링 수행"""
+        if not self.acquire_leadership():
+            logger.info("[Crawl] 다른 프로세스가 리더이므로 이번 크롤링을 건너뜁니다")
+            return
+        try:
+            start_time = time.time()
+            metrics.reset()
+            logger.info(f"[Crawl] Start time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
+
+            
+            # 유지 중인 WebDriver가 죽었거나 메모리 상한을 넘었으면 실행 전에 재시작
+            self.worker.check_health()
+            
+            mediaIds = list(mediaIdList.keys())
+            article_ids = None
+            if settings.crawl_workers > 1:
+                logger.info(f"[Crawl] 동시 수집 모드: 워커 {settings.crawl_workers}개")
+                newsData, article_ids = self.collect_news_concurrently(mediaIds)
+            else:
+                newsData = self.collect_news(mediaIds)
             
             # 수집된 뉴스 데이터를 하나의 리스트로 합치기
             all_news = []
             for press, news_list in newsData.items():
                 all_news.extend(news_list)
-            
-            if all_news:
-                logger.info(f"[Crawl] 총 {len(all_news)}개 뉴스 수집 완료")
-                
-                # 뉴스 요약 및 저장
-                try:
-                    anew_service.process_and_save_summary(all_news)
-                    logger.info("[Crawl] 뉴스 요약 및 저장 완료")
-                except Exception as e:
-                    logger.error(f"[Crawl] 뉴스 요약 및 저장 실패: {e}")
-            else:
-                logger.warning("[Crawl] 수집된 뉴스가 없습니다")
+            self.summarize_news(all_news, article_ids)
             
             end_time = time.time()
             elapsed = end_time - start_time
             logger.info(f"[Crawl] End time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
             logger.info(f"[Crawl] Elapsed time: {elapsed:.4f} seconds")
+            logger.info(f"[Crawl] Metrics: {metrics.snapshot()}")
         except Exception as e:
             logger.error(f"[Crawl] 크롤링 작업 중 오류 발생: {e}")
         finally:
             # WebDriver는 유지 (재사용을 위해)
             pass
     
-    def start_scheduler(self, hour_interval: int = 6):
-        """스케줄러 시작"""
+    def trigger(self, source: str = "manual"):
+        """즉시 실행 요청 (같은 프로세스에서 호출, 대기 중인 스케줄러 루프를 바로 깨움)"""
+        self._manual_trigger = source
+        self._wake_event.set()
+    
+    def request_stop(self):
+        """스케줄러 루프 종료 요청 (실행 중인 작업은 끝까지 수행)"""
+        self.is_running = False
+        self._stop_event.set()
+        self._wake_event.set()
+    
+    def run_job(self, source: str) -> bool:
+        """겹침 방지 후 크롤링 실행 (이전 실행이 끝나지 않았으면 건너뜀)"""
+        if not self._job_lock.acquire(blocking=False):
+            metrics.incr("scheduler.overlap_skipped")
+            logger.warning(f"[Scheduler] 이전 크롤링이 진행 중이어서 실행 요청을 건너뜁니다: {source}")
+            return False
         try:
-            from config import settings
-            
-            # 설정에서 간격 가져오기 (파라미터보다 설정 우선)
-            interval = settings.schedule_interval if hasattr(settings, 'schedule_interval') else hour_interval
+            logger.info(f"[Scheduler] 크롤링 작업 시작: {source}")
+            self.crawl_news()
+            return True
+        finally:
+            self._job_lock.release()
+    
+    def _claim_trigger(self) -> Optional[Dict[str, Any]]:
+        """같은 프로세스 요청 또는 MongoDB에 등록된 수동 실행 요청 가져오기 (리더만 가져감)"""
+        if self._manual_trigger:
+            source, self._manual_trigger = self._manual_trigger, None
+            return {"source": source}
+        if self.leader_lock is not None and not self.acquire_leadership():
+            return None
+        try:
+            owner = self.leader_lock.owner if self.leader_lock is not None else "local"
+            return mongodb.claim_crawl_trigger(owner)
+        except Exception as e:
+            logger.warning(f"[Scheduler] 수동 실행 요청 확인 실패: {e}")
+            return None
+    
+    def _next_run_time(self, scheduled: float, interval: float) -> Tuple[float, float]:
+        """다음 정기 실행 (예정 시각, 지터 포함 실행 시각)
+        
+        실행이 간격보다 길어져 지나간 일정은 쌓아 두지 않고 하나로 합치며,
+        misfire 정책이 run_once이고 허용 지연 이내면 바로 한 번 실행한다.
+        """
+        now = time.time()
+        scheduled += interval
+        if scheduled > now:
+            return scheduled, scheduled + random.uniform(0, settings.schedule_jitter)
+        
+        missed = int((now - scheduled) // interval) + 1
+        metrics.incr("scheduler.misfire", missed)
+        # 허용 지연은 가장 최근에 지나간 일정 기준
+        latest = scheduled + (missed - 1) * interval
+        if settings.schedule_misfire_policy == "run_once" and now - latest <= settings.schedule_misfire_grace:
+            logger.warning(f"[Scheduler] 지난 일정 {missed}회를 한 번으로 합쳐 즉시 실행합니다")
+            return latest, now
+        
+        scheduled += missed * interval
+        logger.warning(f"[Scheduler] 지난 일정 {missed}회를 건너뜁니다 (다음 실행: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(scheduled))})")
+        return scheduled, scheduled + random.uniform(0, settings.schedule_jitter)
+    
+    def start_scheduler(self, hour_interval: Optional[int] = None):
+        """스케줄러 시작 (다음 실행 시각까지 대기하며, 중지/수동 실행 요청 시 바로 깨어남)"""
+        try:
+            # 간격 파라미터가 없으면 설정값 사용
+            interval = hour_interval or settings.schedule_interval
+            interval_seconds = interval * 3600
             
             logger.info(f"[Scheduler] 뉴스 스케줄러 시작 - {interval}시간 간격")
             
-            # WebDriver 설정
-            self.setup_driver()
+            # WebDriver 설정 (HTTP 경로/동시 수집 모드와 리더가 아닌 프로세스는 필요 시 지연 생성)
+            if settings.crawl_backend == "selenium" and settings.crawl_workers <= 1 and self.acquire_leadership():
+                self.setup_driver()
             
-            # 스케줄 설정
-            schedule.every(interval).hours.do(self.crawl_news)
+            self.is_running = True
+            self._stop_event.clear()
             
             # 즉시 첫 번째 실행
-            logger.info("[Scheduler] 첫 번째 크롤링 작업 시작")
-            self.crawl_news()
-            
-            self.is_running = True
+            scheduled = due = time.time()
             
             # 스케줄러 루프
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)  # 1분마다 스케줄 확인
+            while not self._stop_event.is_set():
+                remaining = due - time.time()
+                if remaining > 0:
+                    # 수동 실행 요청(MongoDB)은 SCHEDULE_TRIGGER_POLL초마다 확인
+                    self._wake_event.wait(min(remaining, max(1, settings.schedule_trigger_poll)))
+                    self._wake_event.clear()
+                if self._stop_event.is_set():
+                    break
+                
+                trigger = self._claim_trigger()
+                if trigger:
+                    # 수동 실행은 정기 일정에 영향을 주지 않음
+                    completed = self.run_job(trigger.get("source", "manual"))
+                    if trigger.get("_id"):
+                        try:
+                            mongodb.complete_crawl_trigger(trigger["_id"], "done" if completed else "skipped")
+                        except Exception as e:
+                            logger.warning(f"[Scheduler] 수동 실행 요청 완료 기록 실패: {e}")
+                    continue
+                
+                if time.time() < due:
+                    continue
+                self.run_job("schedule")
+                scheduled, due = self._next_run_time(scheduled, interval_seconds)
+                logger.info(f"[Scheduler] 다음 실행: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(due))}")
                 
         except KeyboardInterrupt:
             logger.info("[Scheduler] 스케줄러 중단 요청 받음")
@@ -159,45 +425,73 @@ class NewsScheduler:
     def stop_scheduler(self):
         """스케줄러 중지"""
         logger.info("[Scheduler] 스케줄러 중지")
-        self.is_running = False
+        self.request_stop()
         self.cleanup_driver()
+        if self.leader_lock is not None:
+            self.leader_lock.release()
     
     def run_once(self):
         """한 번만 실행 (테스트용)"""
         try:
             logger.info("단일 크롤링 작업 시작")
             mongodb.connect()
-            self.setup_driver()
-            self.crawl_news()
+            if settings.crawl_backend == "selenium" and settings.crawl_workers <= 1:
+                self.setup_driver()
+            self.run_job("once")
         except Exception as e:
             logger.error(f"단일 크롤링 작업 실패: {e}")
         finally:
             self.cleanup_driver()
+            if self.leader_lock is not None:
+                self.leader_lock.release()
             mongodb.disconnect()
 
-# def main():
-#     """메인 함수"""
-#     import argparse
-    
-#     parser = argparse.ArgumentParser(description='뉴스 크롤링 스케줄러')
-#     parser.add_argument('--interval', type=int, default=1, 
-#                        help='크롤링 간격 (시간, 기본값: 1)')
-#     parser.add_argument('--once', action='store_true',
-#                        help='한 번만 실행')
-    
-#     args = parser.parse_args()
-    
-#     scheduler = NewsScheduler()
-    
-#     try:
-#         if args.once:
-#             scheduler.run_once()
-#         else:
-#             scheduler.start_scheduler(args.interval)
-#     except KeyboardInterrupt:
-#         logger.info("프로그램 종료")
-#     except Exception as e:
-#         logger.error(f"프로그램 실행 중 오류: {e}")
+def main():
+    """크롤링/요약 워커 실행 (API 프로세스와는 MongoDB로만 통신)"""
+    import argparse
+    import signal
+    
+    parser = argparse.ArgumentParser(description='뉴스 크롤링 스케줄러')
+    parser.add_argument('--interval', type=int, default=settings.schedule_interval, 
+                       help=f'크롤링 간격 (시간, 기본값: {settings.schedule_interval})')
+    parser.add_argument('--once', action='store_true',
+                       help='한 번만 실행')
+    parser.add_argument('--trigger', action='store_true',
+                       help='실행 중인 워커에 즉시 실행 요청 후 종료')
+    
+    args = parser.parse_args()
+    
+    if args.trigger:
+        mongodb.connect()
+        try:
+            trigger_id = mongodb.insert_crawl_trigger("cli")
+            logger.info(f"즉시 실행 요청 등록: {trigger_id}")
+        finally:
+            mongodb.disconnect()
+        return
+    
+    scheduler = NewsScheduler()
+    
+    def handle_sigterm(signum, frame):
+        # 컨테이너 종료(SIGTERM): 대기 중이면 바로, 실행 중이면 현재 작업을 마친 뒤 종료
+        if args.once:
+            raise KeyboardInterrupt()
+        scheduler.request_stop()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
+    try:
+        if args.once:
+            scheduler.run_once()
+        else:
+            mongodb.connect()
+            scheduler.start_scheduler(args.interval)
+    except KeyboardInterrupt:
+        logger.info("프로그램 종료")
+    except Exception as e:
+        logger.error(f"프로그램 실행 중 오류: {e}")
+    finally:
+        if not args.once:
+            mongodb.disconnect()
 
-# if __name__ == "__main__":
-#     main() 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
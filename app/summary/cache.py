@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple
+
+from config import settings
+from logger import get_logger
+from metrics import metrics
+
+logger = get_logger()
+
+class DiskCacheBackend:
+    """키별 JSON 파일로 저장하는 로컬 디스크 캐시"""
+    def __init__(self, directory: str, ttl_seconds: float, max_entries: int):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                os.remove(path)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def set(self, key: str, model_name: str, text: str):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": model_name, "text": text, "created_at": datetime.now().isoformat()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        """항목 수가 상한을 넘으면 오래된 파일부터 삭제"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except FileNotFoundError:
+                continue
+        for _, name in sorted(entries)[:max(len(entries) - self.max_entries, 0)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+class MongoCacheBackend:
+    """MongoDB 컬렉션 캐시 (만료는 created_at TTL 인덱스가 처리)"""
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    def _collection(self):
+        from database import mongodb
+        if mongodb.llm_cache is None:
+            raise Exception("MongoDB가 연결되지 않았습니다. connect() 메서드를 먼저 호출하세요.")
+        return mongodb.llm_cache
+
+    def get(self, key: str) -> Optional[str]:
+        fresh_after = datetime.now() - timedelta(seconds=self.ttl_seconds)
+        doc = self._collection().find_one({"_id": key, "created_at": {"$gte": fresh_after}})
+        return doc["text"] if doc else None
+
+    def set(self, key: str, model_name: str, text: str):
+        collection = self._collection()
+        collection.replace_one(
+            {"_id": key},
+            {"model": model_name, "text": text, "created_at": datetime.now()},
+            upsert=True
+        )
+        overflow = collection.estimated_document_count() - self.max_entries
+        if overflow > 0:
+            oldest = [doc["_id"] for doc in collection.find({}, {"_id": 1}).sort("created_at", 1).limit(overflow)]
+            collection.delete_many({"_id": {"$in": oldest}})
+
+class LLMResponseCache:
+    """모델명 + 생성 설정 + 프롬프트의 해시를 키로 하는 LLM 응답 캐시"""
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name: str, generation_config: Dict[str, Any], prompt: str) -> str:
+        payload = json.dumps([model_name, generation_config, prompt], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, keys: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """{모델명: 키} 중 우선순위대로 처음 찾은 (모델명, 응답) 반환 (조회 1회당 hit/miss 1회 집계)"""
+        found = None
+        for model_name, key in keys.items():
+            try:
+                text = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"LLM 응답 캐시 조회 실패: {e}")
+                break
+            if text is not None:
+                found = (model_name, text)
+                break
+        with self._lock:
+            if found is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        metrics.incr("llm.cache.hit" if found is not None else "llm.cache.miss")
+        return found
+
+    def set(self, key: str, model_name: str, text: str):
+        try:
+            self.backend.set(key, model_name, text)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+def create_llm_cache() -> Optional[LLMResponseCache]:
+    """설정된 백엔드로 캐시 생성 (none이면 캐시 사용 안 함)"""
+    ttl_seconds = settings.llm_cache_ttl * 3600
+    if settings.llm_cache_backend == "disk":
+        return LLMResponseCache(DiskCacheBackend(settings.llm_cache_dir, ttl_seconds, settings.llm_cache_max_entries))
+    if settings.llm_cache_backend == "mongodb":
+        return LLMResponseCache(MongoCacheBackend(ttl_seconds, settings.llm_cache_max_entries))
+    return None
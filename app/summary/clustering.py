@@ -0,0 +1,99 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
+from summary.models import NewsCluster
+
+# 제목은 주제를 가장 잘 드러내므로 본문보다 가중치를 높게 줌
+TITLE_WEIGHT = 3
+CONTENT_CHARS = 600
+
+def _tokenize(text: str) -> List[str]:
+    """한국어 조사/어미 변화에 강하도록 단어 내부 문자 bigram으로 토큰화"""
+    tokens = []
+    for word in re.findall(r"\w+", text.lower()):
+        if len(word) < 2:
+            continue
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def _article_tokens(article: dict) -> List[str]:
+    title = article.get("title") or ""
+    content = (article.get("content") or "")[:CONTENT_CHARS]
+    return _tokenize(title) * TITLE_WEIGHT + _tokenize(content)
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    if not norm:
+        return vector
+    return {k: v / norm for k, v in vector.items()}
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+def _tfidf_vectors(news_list: List[dict]) -> List[Dict[str, float]]:
+    term_counts = [Counter(_article_tokens(article)) for article in news_list]
+    doc_freq = Counter(term for counts in term_counts for term in counts)
+    n_docs = len(news_list)
+    vectors = []
+    for counts in term_counts:
+        vector = {
+            term: (1 + math.log(count)) * (math.log((n_docs + 1) / (doc_freq[term] + 1)) + 1)
+            for term, count in counts.items()
+        }
+        vectors.append(_normalize(vector))
+    return vectors
+
+def cluster_news(news_list: List[dict],
+                 similarity_threshold: float,
+                 duplicate_threshold: float) -> List[NewsCluster]:
+    """TF-IDF 코사인 유사도로 기사를 주제별로 묶고, 거의 같은 기사는 대표 기사 하나로 합친 뒤 크기순 정렬"""
+    if not news_list:
+        return []
+
+    vectors = _tfidf_vectors(news_list)
+
+    # 1. 입력 순서대로 가장 가까운 클러스터 중심에 배정 (결정적)
+    members: List[List[int]] = []
+    centroids: List[Dict[str, float]] = []
+    for idx, vector in enumerate(vectors):
+        best, best_sim = None, similarity_threshold
+        for c, centroid in enumerate(centroids):
+            sim = _cosine(vector, centroid)
+            if sim >= best_sim:
+                best, best_sim = c, sim
+        if best is None:
+            members.append([idx])
+            centroids.append(dict(vector))
+            continue
+        members[best].append(idx)
+        merged = Counter(centroids[best])
+        for term, value in vector.items():
+            merged[term] += value
+        centroids[best] = _normalize(dict(merged))
+
+    # 2. 클러스터 내 중복 기사 제거 (본문이 가장 긴 기사를 대표로 유지)
+    clusters = []
+    for indices in members:
+        ordered = sorted(indices, key=lambda i: -len(news_list[i].get("content") or ""))
+        representatives: List[int] = []
+        duplicate_urls: List[str] = []
+        for i in ordered:
+            if any(_cosine(vectors[i], vectors[r]) >= duplicate_threshold for r in representatives):
+                duplicate_urls.append(news_list[i].get("url"))
+            else:
+                representatives.append(i)
+        representatives.sort()
+        clusters.append((indices, NewsCluster(
+            articles=[news_list[i] for i in representatives],
+            duplicate_urls=duplicate_urls,
+            press_count=len({news_list[i].get("press") for i in indices}),
+            size=len(indices)
+        )))
+
+    # 3. 여러 언론사가 다룬 주제, 기사 수가 많은 주제 순으로 정렬 (동률이면 먼저 나온 주제)
+    clusters.sort(key=lambda item: (-item[1].press_count, -item[1].size, item[0][0]))
+    return [cluster for _, cluster in clusters]
@@ -0,0 +1,73 @@
+import json
+from typing import Any, List
+
+class JsonArrayStreamParser:
+    """조각으로 도착하는 JSON 배열에서 완성된 최상위 원소(객체)를 순서대로 꺼내는 파서
+
+    응답 앞뒤의 ```json 마커나 설명 텍스트는 무시하며, 배열 대신 객체 하나만 오는 응답도 처리한다.
+    설명 텍스트 안의 "[3]" 같은 괄호는 건너뛰도록, "["는 공백 뒤에 "{"나 "["가 올 때만 최상위 배열로 본다.
+    """
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._root = None        # "[" 또는 "{" (최상위 구조)
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start = None
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """새 조각을 추가하고 이번에 완성된 원소 목록 반환"""
+        self._buffer += chunk
+        items = []
+        while self._pos < len(self._buffer) and not self.done:
+            char = self._buffer[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif self._root is None:
+                if char == "[":
+                    following = self._buffer[self._pos + 1:].lstrip()
+                    if not following:
+                        break  # 다음 조각이 와야 최상위 배열인지 판단 가능
+                    if following[0] in "[{":
+                        self._root = char
+                        self._depth = 1
+                elif char == "{":
+                    self._root = char
+                    self._depth = 1
+                    self._item_start = self._pos
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if self._depth == 1 and self._root == "[":
+                    self._item_start = self._pos
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                closes_item = (self._root == "[" and self._depth == 1) or (self._root == "{" and self._depth == 0)
+                if closes_item and self._item_start is not None:
+                    item = self._decode(self._buffer[self._item_start:self._pos + 1])
+                    if item is not None:
+                        items.append(item)
+                    self._item_start = None
+                if self._depth == 0:
+                    self.done = True
+            self._pos += 1
+        return items
+
+    @staticmethod
+    def _decode(text: str) -> Any:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+def parse_json_items(text: str) -> List[Any]:
+    """전체 응답 텍스트에서 완성된 원소만 추출 (잘리거나 일부가 깨진 응답에도 사용)"""
+    return JsonArrayStreamParser().feed(text)
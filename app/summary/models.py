@@ -5,6 +5,12 @@ class NewsSummaryRequest(BaseModel):
     news_list: list[dict] = Field(..., description="뉴스 목록")
     max_length: Optional[int] = Field(default=200, description="요약 최대 길이", ge=50, le=1000)
     
+class NewsCluster(BaseModel):
+    articles: List[dict] = Field(..., description="주제에 속한 대표 기사 목록 (중복 기사 제외)")
+    duplicate_urls: List[str] = Field(default_factory=list, description="대표 기사로 합쳐진 중복 기사 URL 목록")
+    press_count: int = Field(..., description="주제를 다룬 언론사 수")
+    size: int = Field(..., description="중복 기사를 포함한 전체 기사 수")
+    
 class Perspective(BaseModel):
     title: str = Field(..., description="관점 이름")
     icon: str = Field(..., description="관점을 나타내는 이모지")
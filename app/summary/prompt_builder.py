@@ -0,0 +1,115 @@
+import copy
+import json
+import re
+from typing import Any, List
+
+from config import settings
+from logger import get_logger
+
+logger = get_logger()
+
+# 네이버 뉴스 본문에 반복되는 바이라인/저작권/사진 설명 등 (요약에 불필요)
+BOILERPLATE_PATTERNS = [
+    re.compile(r"\[[^\[\]\n]{0,40}(?:기자|특파원|논설위원)\]"),               # [서울=홍길동 기자]
+    re.compile(r"[가-힣]{2,4}\s*(?:기자|특파원|논설위원)\s*[\w.+-]+@[\w-]+(?:\.[\w-]+)+"),  # 홍길동 기자 hong@mk.co.kr
+    re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"),                              # 이메일
+    re.compile(r"copyright[^\n]{0,60}?(?:금지|reserved\.?)", re.IGNORECASE),
+    re.compile(r"[ⓒ©Ⓒ][^\n]{0,60}?(?:금지|reserved\.?)", re.IGNORECASE),       # ⓒ 매일경제 & mk.co.kr, 무단전재 및 재배포 금지
+    re.compile(r"[<(]?\s*(?:저작권자|무단\s*전재)[^\n]{0,60}?(?:금지|reserved)\s*[>)]?", re.IGNORECASE),
+    re.compile(r"(?:사진|그래픽|영상|자료)\s*[=:]\s*[^\n]{0,30}?(?:제공|뉴스|DB|통신|기자)"),  # 사진=연합뉴스
+    re.compile(r"(?:기사\s*제보|구독\s*신청|좋아요\s*응원)[^\n]{0,80}"),
+]
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|\n+")
+HANGUL = re.compile(r"[가-힣]")
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정 (한글은 글자당 토큰 비중이 커서 따로 계산)"""
+    if not text:
+        return 0
+    hangul = len(HANGUL.findall(text))
+    return int(hangul / settings.prompt_hangul_chars_per_token + (len(text) - hangul) / settings.prompt_chars_per_token) + 1
+
+def strip_boilerplate(text: str) -> str:
+    if not text:
+        return text
+    for pattern in BOILERPLATE_PATTERNS:
+        text = pattern.sub(" ", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    return re.sub(r"\s*\n\s*", "\n", text).strip()
+
+def trim_text(text: str, max_tokens: int) -> str:
+    """앞 문장부터 예산 안에서 추출 (리드 문장이 가장 중요한 기사 구조)"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    kept = []
+    used = 0
+    for sentence in SENTENCE_SPLIT.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        cost = estimate_tokens(sentence)
+        if used + cost > max_tokens:
+            break
+        kept.append(sentence)
+        used += cost
+    if kept:
+        return " ".join(kept)
+    # 첫 문장조차 예산을 넘으면 글자 수 비율로 자름
+    ratio = max_tokens / max(estimate_tokens(text), 1)
+    return text[:max(1, int(len(text) * ratio))]
+
+def to_compact_json(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+class PromptBuilder:
+    """토큰 예산 안에서 기사 데이터를 압축 직렬화하여 프롬프트 생성"""
+    def __init__(self, token_budget: int):
+        self.token_budget = token_budget
+
+    def _collect_articles(self, payload: Any) -> List[dict]:
+        """기사 목록 또는 주제({"articles": [...]}) 목록에서 기사 dict 수집"""
+        items = payload if isinstance(payload, list) else [payload]
+        articles = []
+        for item in items:
+            if isinstance(item, dict) and "articles" in item:
+                articles.extend(item["articles"])
+            elif isinstance(item, dict):
+                articles.append(item)
+        return articles
+
+    def _render(self, template: str, news_json: str, values: dict) -> str:
+        prompt = template
+        for key, value in values.items():
+            prompt = prompt.replace(f"{{{key}}}", str(value))
+        return prompt.replace("{news_json}", news_json)
+
+    def build(self, template: str, payload: Any, **values) -> str:
+        payload = copy.deepcopy(payload)
+        articles = self._collect_articles(payload)
+        for article in articles:
+            article["content"] = strip_boilerplate(article.get("content"))
+
+        # 본문을 제외한 프롬프트(지시문, 제목, URL 등)를 먼저 계산하고 남은 예산을 본문에 배분
+        contents = [article.get("content") or "" for article in articles]
+        for article in articles:
+            article["content"] = ""
+        overhead = estimate_tokens(self._render(template, to_compact_json(payload), values))
+        content_budget = max(self.token_budget - overhead, 0)
+
+        lengths = [estimate_tokens(content) for content in contents]
+        total = sum(lengths)
+        for article, content, length in zip(articles, contents, lengths):
+            if total > content_budget and length:
+                # 기사 길이에 비례하여 예산 배분 (최소 분량 보장)
+                allowed = max(settings.prompt_min_article_tokens, content_budget * length // total)
+                content = trim_text(content, allowed)
+            article["content"] = content
+
+        prompt = self._render(template, to_compact_json(payload), values)
+        estimated = estimate_tokens(prompt)
+        logger.info(
+            f"프롬프트 예상 토큰: {estimated} (예산 {self.token_budget}, 기사 {len(articles)}개, "
+            f"본문 원본 {total} -> {estimated - overhead})"
+        )
+        return prompt
@@ -0,0 +1,229 @@
+import http.client as httplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Any, List, Tuple
+
+import google.generativeai as genai
+
+from config import settings
+from logger import get_logger
+from metrics import metrics
+
+logger = get_logger()
+
+class EmptyResponseError(Exception):
+    """모델이 빈 응답을 반환한 경우 (다음 모델로 넘어감)"""
+
+class StreamInterruptedError(Exception):
+    """스트리밍 도중 끊긴 경우 (이미 전달된 조각이 있으므로 다른 모델로 재시작하지 않음)"""
+    def __init__(self, model_name: str, partial_text: str, cause: Exception):
+        super().__init__(f"모델 {model_name} 스트리밍 중단: {cause}")
+        self.model_name = model_name
+        self.partial_text = partial_text
+
+def is_overloaded(error: Exception) -> bool:
+    """503 서비스 과부하 에러 여부"""
+    if getattr(error, "code", None) == httplib.SERVICE_UNAVAILABLE:
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == httplib.SERVICE_UNAVAILABLE
+
+class ModelHealth:
+    """모델별 지연 시간/에러율과 서킷 상태"""
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency_ewma = None
+        self.consecutive_overloads = 0
+        self.open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "error_rate": round(self.errors / self.requests, 3) if self.requests else 0.0,
+            "latency_ewma": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+            "circuit_open": self.is_open()
+        }
+
+class ModelRouter:
+    """모델 클라이언트를 재사용하고, 상태에 따라 모델 순서를 정하며, 필요하면 예비 모델로 헤지 요청"""
+    def __init__(self, model_names: List[str]):
+        self.model_names = [name.strip() for name in model_names if name.strip()]
+        self._clients: Dict[str, genai.GenerativeModel] = {}
+        self._health = {name: ModelHealth() for name in self.model_names}
+        self._lock = threading.Lock()
+
+    def get_client(self, model_name: str) -> genai.GenerativeModel:
+        with self._lock:
+            if model_name not in self._clients:
+                self._clients[model_name] = genai.GenerativeModel(model_name)
+            return self._clients[model_name]
+
+    def ordered_models(self) -> List[str]:
+        """서킷이 닫힌 모델을 우선순위대로, 열린 모델은 마지막에 (모두 열려도 시도는 함)"""
+        with self._lock:
+            healthy = [name for name in self.model_names if not self._health[name].is_open()]
+            tripped = [name for name in self.model_names if self._health[name].is_open()]
+        if tripped:
+            logger.info(f"서킷 열린 모델 후순위 처리: {tripped}")
+        return healthy + tripped
+
+    def _record(self, model_name: str, latency: float, error: Exception = None):
+        with self._lock:
+            health = self._health[model_name]
+            health.requests += 1
+            if error is None:
+                health.consecutive_overloads = 0
+                health.open_until = 0.0
+                alpha = 0.3
+                health.latency_ewma = latency if health.latency_ewma is None else alpha * latency + (1 - alpha) * health.latency_ewma
+                return
+            health.errors += 1
+            if is_overloaded(error):
+                health.consecutive_overloads += 1
+                if health.consecutive_overloads >= settings.llm_circuit_failure_threshold:
+                    health.open_until = time.monotonic() + settings.llm_circuit_cooldown
+                    logger.warning(
+                        f"모델 {model_name} 서킷 열림: 연속 과부하 {health.consecutive_overloads}회, "
+                        f"{settings.llm_circuit_cooldown}초 동안 후순위"
+                    )
+
+    def _call(self, model_name: str, prompt: str, generation_config: Dict[str, Any]) -> str:
+        started = time.monotonic()
+        try:
+            logger.info(f"모델 {model_name}로 요청 시도")
+            response = self.get_client(model_name).generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(**generation_config)
+            )
+            if not response.text:
+                raise EmptyResponseError(f"모델 {model_name}이 빈 응답을 반환했습니다.")
+            latency = time.monotonic() - started
+            self._record(model_name, latency)
+            metrics.observe(f"llm.latency.{model_name}", latency)
+            logger.info(f"모델 {model_name}로 성공적으로 응답 받음 ({latency:.1f}초)")
+            return response.text.strip()
+        except Exception as e:
+            self._record(model_name, time.monotonic() - started, e)
+            raise
+
+    def _should_fall_back(self, model_name: str, error: Exception) -> bool:
+        if is_overloaded(error):
+            logger.warning(f"모델 {model_name}에서 서비스 과부하 에러. 다음 모델로 시도합니다...")
+            return True
+        if isinstance(error, EmptyResponseError):
+            logger.warning(f"{error} 다음 모델로 시도합니다...")
+            return True
+        logger.error(f"모델 {model_name}에서 예상치 못한 에러 발생: {error}")
+        return False
+
+    def generate(self, prompt: str, generation_config: Dict[str, Any]) -> Tuple[str, str]:
+        """(응답한 모델명, 응답 텍스트) 반환"""
+        models = self.ordered_models()
+        if settings.llm_hedge_enabled and len(models) > 1:
+            return self._generate_hedged(models, prompt, generation_config)
+
+        for model_name in models:
+            try:
+                return model_name, self._call(model_name, prompt, generation_config)
+            except Exception as e:
+                if not self._should_fall_back(model_name, e):
+                    raise
+        logger.error("모든 모델이 응답 생성에 실패했습니다.")
+        raise Exception("모든 모델이 응답 생성에 실패했습니다.")
+
+    def generate_stream(self, prompt: str, generation_config: Dict[str, Any],
+                        on_text: Callable[[str], None]) -> Tuple[str, str]:
+        """스트리밍으로 생성하며 도착하는 조각마다 on_text 호출, (모델명, 전체 텍스트) 반환
+
+        첫 조각 전에 실패하면 다음 모델로 넘어가고, 조각을 받은 뒤 끊기면 StreamInterruptedError 발생
+        """
+        for model_name in self.ordered_models():
+            started = time.monotonic()
+            received = []
+            try:
+                logger.info(f"모델 {model_name}로 스트리밍 요청 시도")
+                response = self.get_client(model_name).generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(**generation_config),
+                    stream=True
+                )
+                finish_reason = None
+                for chunk in response:
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        # 종료 사유만 담긴 마지막 조각 등 텍스트가 없는 조각
+                        text = ""
+                    if chunk.candidates:
+                        finish_reason = chunk.candidates[0].finish_reason
+                    if not text:
+                        continue
+                    if not received:
+                        metrics.observe(f"llm.first_chunk.{model_name}", time.monotonic() - started)
+                    received.append(text)
+                    on_text(text)
+                if not received:
+                    raise EmptyResponseError(f"모델 {model_name}이 빈 응답을 반환했습니다.")
+
+                latency = time.monotonic() - started
+                self._record(model_name, latency)
+                metrics.observe(f"llm.latency.{model_name}", latency)
+                if getattr(finish_reason, "name", finish_reason) == "MAX_TOKENS":
+                    logger.warning(f"모델 {model_name} 응답이 MAX_TOKENS에서 잘렸습니다.")
+                logger.info(f"모델 {model_name}로 스트리밍 응답 완료 ({latency:.1f}초)")
+                return model_name, "".join(received).strip()
+            except Exception as e:
+                self._record(model_name, time.monotonic() - started, e)
+                if received:
+                    raise StreamInterruptedError(model_name, "".join(received), e)
+                if not self._should_fall_back(model_name, e):
+                    raise
+        logger.error("모든 모델이 응답 생성에 실패했습니다.")
+        raise Exception("모든 모델이 응답 생성에 실패했습니다.")
+
+    def _generate_hedged(self, models: List[str], prompt: str, generation_config: Dict[str, Any]) -> Tuple[str, str]:
+        """지연 임계값을 넘으면 다음 모델에도 요청을 보내고 먼저 성공한 응답을 사용"""
+        executor = ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="llm-hedge")
+        pending = {}
+        next_index = 0
+
+        def launch():
+            nonlocal next_index
+            model_name = models[next_index]
+            next_index += 1
+            pending[executor.submit(self._call, model_name, prompt, generation_config)] = model_name
+
+        try:
+            launch()
+            while pending:
+                timeout = settings.llm_hedge_delay if next_index < len(models) else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.info(f"{settings.llm_hedge_delay}초 내 응답 없음, 헤지 요청: {models[next_index]}")
+                    metrics.incr("llm.hedge")
+                    launch()
+                    continue
+                for future in done:
+                    model_name = pending.pop(future)
+                    try:
+                        return model_name, future.result()
+                    except Exception as e:
+                        if not self._should_fall_back(model_name, e):
+                            raise
+                if not pending and next_index < len(models):
+                    launch()
+        finally:
+            # 늦게 끝나는 요청은 기다리지 않음 (결과는 버려짐)
+            executor.shutdown(wait=False)
+
+        logger.error("모든 모델이 응답 생성에 실패했습니다.")
+        raise Exception("모든 모델이 응답 생성에 실패했습니다.")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: health.to_dict() for name, health in self._health.items()}
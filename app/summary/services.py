@@ -1,14 +1,30 @@
 import os
 import json
 import re
+import time
 import google.generativeai as genai
-import http.client as httplib
+from typing import Optional, Callable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 from config import settings
 from logger import get_logger
-from summary.models import NewsSummaryRequest, NewsSummaryResponse, NewsSummaryItem
+from summary.models import NewsSummaryRequest, NewsSummaryResponse, NewsSummaryItem, NewsCluster
+from summary.clustering import cluster_news
+from summary.prompt_builder import PromptBuilder
+from summary.cache import LLMResponseCache, create_llm_cache
+from summary.router import ModelRouter, StreamInterruptedError
+from summary.json_stream import JsonArrayStreamParser, parse_json_items
+from metrics import metrics
 
 logger = get_logger()
 
+T = TypeVar("T")
+
+class InvalidResponseError(Exception):
+    """모델 응답이 검증을 통과하지 못함 (원본 응답은 text, 원인 예외는 __cause__)"""
+    def __init__(self, message: str, text: str):
+        super().__init__(message)
+        self.text = text
+
 class NewsSummaryService:
     def __init__(self):
         if not settings.google_api_key:
@@ -17,6 +33,11 @@ class NewsSummaryService:
         # Google Gemini API initialize
         genai.configure(api_key=settings.google_api_key)
         self.prompt_template = self._load_prompt_template("summary/prompts/news_summary_prompt.txt")
+        self.cluster_prompt_template = self._load_prompt_template("summary/prompts/news_cluster_summary_prompt.txt")
+        self.topic_prompt_template = self._load_prompt_template("summary/prompts/news_topic_summary_prompt.txt")
+        self.prompt_builder = PromptBuilder(settings.prompt_token_budget)
+        self.response_cache = create_llm_cache()
+        self.model_router = ModelRouter([settings.model_name] + settings.fallback_models)
 
     def _load_prompt_template(self, path: str) -> str:
         if not os.path.exists(path):
@@ -25,11 +46,87 @@ class NewsSummaryService:
             return f.read()
 
     def _get_prompt(self, news_list: list[dict], max_length: int, summary_news_count: int) -> str:
-        news_json = json.dumps(news_list, ensure_ascii=False, indent=2)
-        prompt = self.prompt_template.replace("{max_length}", str(max_length))
-        prompt = prompt.replace("{summary_news_count}", str(summary_news_count))
-        prompt = prompt.replace("{news_json}", news_json)
-        return prompt
+        return self.prompt_builder.build(
+            self.prompt_template,
+            news_list,
+            max_length=max_length,
+            summary_news_count=summary_news_count
+        )
+    
+    def build_clusters(self, news_list: list[dict]) -> list[NewsCluster]:
+        """기사를 주제별로 묶고 중복 기사를 합친 뒤, 많이 다뤄진 순으로 상위 summary_news_count개 주제 반환"""
+        clusters = cluster_news(
+            news_list,
+            settings.cluster_similarity_threshold,
+            settings.duplicate_similarity_threshold
+        )
+        selected = clusters[:settings.summary_news_count]
+        logger.info(
+            f"사전 클러스터링: 기사 {len(news_list)}개 -> 주제 {len(clusters)}개, "
+            f"선택된 주제 크기 {[cluster.size for cluster in selected]}"
+        )
+        return selected
+    
+    def _get_cluster_prompt(self, clusters: list[NewsCluster], max_length: int) -> str:
+        topics = [
+            {
+                "articles": cluster.articles,
+                "related_urls": cluster.duplicate_urls
+            }
+            for cluster in clusters
+        ]
+        return self.prompt_builder.build(
+            self.cluster_prompt_template,
+            topics,
+            max_length=max_length,
+            summary_news_count=len(clusters)
+        )
+    
+    def _get_topic_prompt(self, cluster: NewsCluster, max_length: int) -> str:
+        return self.prompt_builder.build(
+            self.topic_prompt_template,
+            cluster.articles,
+            max_length=max_length
+        )
+    
+    def _summarize_cluster(self, cluster: NewsCluster, max_length: int) -> NewsSummaryItem:
+        """주제 하나를 요약 (실패 시 이 주제만 재시도)"""
+        prompt = self._get_topic_prompt(cluster, max_length)
+        
+        def parse_item(summary_text: str) -> NewsSummaryItem:
+            item_data = json.loads(self._extract_json_from_response(summary_text))
+            if isinstance(item_data, list):
+                item_data = item_data[0]
+            # 참조 URL은 모델 출력 대신 클러스터 구성에서 결정
+            item_data["reference_url"] = [article.get("url") for article in cluster.articles] + cluster.duplicate_urls
+            return NewsSummaryItem(**item_data)
+        
+        last_error = None
+        for attempt in range(settings.summary_topic_retries + 1):
+            try:
+                # 검증에 실패한 응답은 캐시되지 않으므로 재시도는 새 응답을 받음
+                return self._generate_with_fallback(prompt, parse_item)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"주제 요약 실패 (시도 {attempt + 1}/{settings.summary_topic_retries + 1}): {e}")
+        raise Exception(f"주제 요약에 실패했습니다: {str(last_error)}")
+    
+    def _summarize_clusters(self, clusters: list[NewsCluster], max_length: int) -> list[NewsSummaryItem]:
+        """주제별 요약 요청을 동시에 보내고 (동시성 제한), 주제 순서대로 결과 병합"""
+        with ThreadPoolExecutor(max_workers=max(1, settings.summary_concurrency)) as executor:
+            futures = [executor.submit(self._summarize_cluster, cluster, max_length) for cluster in clusters]
+        
+        summary_items = []
+        for index, future in enumerate(futures):
+            try:
+                summary_items.append(future.result())
+            except Exception as e:
+                logger.error(f"주제 {index + 1} 요약 제외: {e}")
+        
+        if not summary_items:
+            raise Exception("모든 주제 요약에 실패했습니다.")
+        logger.info(f"주제별 요약 완료: {len(summary_items)}/{len(clusters)}개")
+        return summary_items
     
     def _extract_json_from_response(self, response_text: str) -> str:
         """AI 응답에서 JSON 마커를 제거하고 순수한 JSON만 추출"""
@@ -49,68 +146,203 @@ class NewsSummaryService:
         # 마커가 없으면 전체 텍스트 반환 (이미 순수 JSON일 가능성)
         return response_text.strip()
     
-    def _generate_with_fallback(self, prompt: str) -> str:
-        """메인 모델과 예비 모델들을 사용하여 재시도"""
-        models_to_try = [settings.model_name] + settings.fallback_models
+    def _generation_config(self) -> dict:
+        return {
+            "max_output_tokens": settings.max_tokens,
+            "temperature": settings.temperature
+        }
+    
+    def _cache_keys(self, prompt: str, generation_config: dict) -> dict:
+        return {
+            model_name: LLMResponseCache.make_key(model_name, generation_config, prompt)
+            for model_name in self.model_router.model_names
+        }
+    
+    def _generate_with_fallback(self, prompt: str, parse: Callable[[str], T]) -> T:
+        """메인 모델과 예비 모델들을 사용하여 재시도 (모델 순서/헤지는 ModelRouter가 결정)
+        
+        응답은 parse로 검증한 뒤 결과를 반환하며, 검증을 통과한 응답만 캐시한다.
+        검증에 실패하면 원본 응답을 담은 InvalidResponseError를 발생시킨다.
+        """
+        generation_config = self._generation_config()
+        
+        # 같은 프롬프트로 이미 받은 응답이 있으면 모델 우선순위대로 재사용
+        cache_keys = self._cache_keys(prompt, generation_config)
+        if self.response_cache:
+            cached = self.response_cache.get(cache_keys)
+            if cached:
+                try:
+                    result = parse(cached[1])
+                    logger.info(f"모델 {cached[0]} 캐시된 응답 사용 (캐시 {self.response_cache.stats()})")
+                    return result
+                except Exception as e:
+                    logger.warning(f"캐시된 응답 검증 실패, 새로 요청합니다: {e}")
+        
+        model_name, summary_text = self.model_router.generate(prompt, generation_config)
+        logger.debug(f"모델 상태: {self.model_router.stats()}")
+        logger.info(f"AI 요약 응답: {summary_text[:200]}...")  # 로그에 응답 일부 기록
+        try:
+            result = parse(summary_text)
+        except Exception as e:
+            raise InvalidResponseError(f"응답 검증 실패: {str(e)}", summary_text) from e
+        if self.response_cache:
+            self.response_cache.set(cache_keys[model_name], model_name, summary_text)
+        return result
+    
+    def _parse_items(self, summary_text: str) -> list[NewsSummaryItem]:
+        """응답 전체를 JSON 배열로 파싱하여 모든 항목 검증"""
+        # JSON 마커 제거 및 순수 JSON 추출
+        cleaned_text = self._extract_json_from_response(summary_text)
+        summary_data = json.loads(cleaned_text)
+        return [NewsSummaryItem(**item) for item in summary_data]
+    
+    def _generate_items_streaming(self, prompt: str) -> list[NewsSummaryItem]:
+        """스트리밍 응답의 JSON 배열을 점진적으로 파싱하여 항목이 닫힐 때마다 검증 (잘려도 완성된 항목 유지)"""
+        parser = JsonArrayStreamParser()
+        summary_items = []
+        started = time.monotonic()
+        
+        def on_text(text: str):
+            for item_data in parser.feed(text):
+                try:
+                    summary_items.append(NewsSummaryItem(**item_data))
+                except Exception as e:
+                    logger.warning(f"요약 항목 검증 실패, 건너뜁니다: {e}")
+                    continue
+                elapsed = time.monotonic() - started
+                if len(summary_items) == 1:
+                    metrics.observe("llm.time_to_first_item", elapsed)
+                logger.info(f"요약 항목 {len(summary_items)}개 수신 ({elapsed:.1f}초)")
         
-        for model_name in models_to_try:
+        generation_config = self._generation_config()
+        cache_keys = self._cache_keys(prompt, generation_config)
+        if self.response_cache:
+            cached = self.response_cache.get(cache_keys)
+            if cached:
+                logger.info(f"모델 {cached[0]} 캐시된 응답 사용 (캐시 {self.response_cache.stats()})")
+                on_text(cached[1])
+                return summary_items
+        
+        try:
+            model_name, summary_text = self.model_router.generate_stream(prompt, generation_config, on_text)
+            # 배열이 끝까지 닫힌 완전한 응답만 캐시
+            if self.response_cache and parser.done:
+                self.response_cache.set(cache_keys[model_name], model_name, summary_text)
+            if not parser.done:
+                logger.warning(f"응답 JSON 배열이 닫히지 않았습니다. 완성된 항목 {len(summary_items)}개만 사용합니다.")
+        except StreamInterruptedError as e:
+            logger.warning(f"{e}. 완성된 항목 {len(summary_items)}개만 사용합니다.")
+        return summary_items
+    
+    def _salvage_items(self, summary_text: str) -> list[NewsSummaryItem]:
+        """깨지거나 잘린 응답 배열에서 형식이 올바른 항목만 복구"""
+        summary_items = []
+        for item_data in parse_json_items(summary_text):
             try:
-                logger.info(f"모델 {model_name}로 요청 시도")
-                
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=settings.max_tokens,
-                        temperature=settings.temperature
-                    )
-                )
-                
-                if response.text:
-                    logger.info(f"모델 {model_name}로 성공적으로 응답 받음")
-                    return response.text.strip()
-                
+                summary_items.append(NewsSummaryItem(**item_data))
             except Exception as e:
-                if hasattr(e, 'response') and e.response.status_code == httplib.SERVICE_UNAVAILABLE:
-                    logger.warning(f"모델 {model_name}에서 서비스 과부하 에러. 상태 코드: {e.response.status_code}. 다음 모델로 시도합니다...")
-                    continue
-                else:
-                    logger.error(f"모델 {model_name}에서 예상치 못한 에러 발생: {e}")
-                    raise e
+                logger.warning(f"요약 항목 검증 실패, 건너뜁니다: {e}")
+        return summary_items
+    
+    def _save_failed_response(self, summary_text: str):
+        """파싱 실패 시 원본 응답을 파일로 저장"""
+        import datetime
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"failed_response_{timestamp}.txt"
         
-        logger.error("모든 모델이 응답 생성에 실패했습니다.")
-        raise Exception("모든 모델이 응답 생성에 실패했습니다.")
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(summary_text)
+            logger.error(f"JSON 파싱 실패. 원본 응답을 {filename}에 저장했습니다.")
+        except Exception as save_error:
+            logger.error(f"파일 저장 중 오류: {save_error}")
     
-    def summarize_news(self, request: NewsSummaryRequest) -> NewsSummaryResponse:
+    def _repair_missing_items(self, summary_items: list[NewsSummaryItem], news_list: list[dict],
+                              clusters: Optional[list[NewsCluster]], max_length: int) -> list[NewsSummaryItem]:
+        """일부 주제만 복구된 경우, 빠진 주제에 대해서만 후속 요청 (전체 프롬프트는 반복하지 않음)"""
+        expected = len(clusters) if clusters is not None else settings.summary_news_count
+        missing = expected - len(summary_items)
+        if not summary_items or missing <= 0:
+            return summary_items
+        
+        covered = {url for item in summary_items for url in item.reference_url}
+        logger.warning(f"요약 항목 {len(summary_items)}/{expected}개만 확보, 빠진 {missing}개 주제 보충 요청")
+        metrics.incr("llm.repair_requests")
+        
+        if clusters is not None:
+            # 이미 요약된 항목의 참조 URL과 겹치지 않는 주제만 주제별 요청으로 보충
+            missing_clusters = [
+                cluster for cluster in clusters
+                if not covered & ({article.get("url") for article in cluster.articles} | set(cluster.duplicate_urls))
+            ]
+            repaired = list(summary_items)
+            for cluster in missing_clusters[:missing]:
+                try:
+                    repaired.append(self._summarize_cluster(cluster, max_length))
+                except Exception as e:
+                    logger.error(f"빠진 주제 보충 실패: {e}")
+            return repaired
+        
+        # 모델이 직접 클러스터링한 경우: 아직 다루지 않은 기사만으로 빠진 개수만큼 요청
+        remaining = [news for news in news_list if news.get("url") not in covered]
+        if not remaining:
+            return summary_items
+        def parse_repair(repair_text: str) -> list[NewsSummaryItem]:
+            repaired = self._salvage_items(repair_text)
+            if not repaired:
+                raise ValueError("보충 응답에 유효한 요약 항목이 없습니다.")
+            return repaired
+        
         try:
-            prompt = self._get_prompt(request.news_list, request.max_length or 200, settings.summary_news_count)
-
-            summary_text = self._generate_with_fallback(prompt)
-
-            logger.info(f"AI 요약 응답: {summary_text[:200]}...")  # 로그에 응답 일부 기록
+            repaired = self._generate_with_fallback(self._get_prompt(remaining, max_length, missing), parse_repair)
+            return summary_items + repaired[:missing]
+        except Exception as e:
+            logger.error(f"빠진 주제 보충 실패: {e}")
+            return summary_items
+    
+    def uses_clusters(self) -> bool:
+        """요약 요청에 사전 클러스터링 결과를 사용하는지 여부"""
+        return settings.summary_mode == "map_reduce" or settings.summary_pre_cluster
+    
+    def summarize_news(self, request: NewsSummaryRequest,
+                       clusters: Optional[list[NewsCluster]] = None) -> NewsSummaryResponse:
+        """뉴스 요약 (clusters가 주어지면 다시 클러스터링하지 않고 사용)"""
+        try:
+            if self.uses_clusters() and clusters is None:
+                clusters = self.build_clusters(request.news_list)
             
-            try:
-                # JSON 마커 제거 및 순수 JSON 추출
-                cleaned_text = self._extract_json_from_response(summary_text)
-                summary_data = json.loads(cleaned_text)
-                summary_items = [NewsSummaryItem(**item) for item in summary_data]
-            except json.JSONDecodeError as e:
-                # JSON 파싱 실패 시 원본 응답을 파일로 저장
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"failed_response_{timestamp}.txt"
-                
+            if settings.summary_mode == "map_reduce":
+                # 주제별로 나눠 동시에 요약 (한 주제 실패가 전체 실패로 이어지지 않음)
+                summary_items = self._summarize_clusters(clusters, request.max_length or 200)
+                return NewsSummaryResponse(summary=summary_items)
+            
+            if settings.summary_pre_cluster:
+                prompt = self._get_cluster_prompt(clusters, request.max_length or 200)
+            else:
+                prompt = self._get_prompt(request.news_list, request.max_length or 200, settings.summary_news_count)
+            
+            if settings.llm_streaming:
+                summary_items = self._generate_items_streaming(prompt)
+                if not summary_items:
+                    raise Exception("스트리밍 응답에서 유효한 요약 항목을 얻지 못했습니다.")
+            else:
                 try:
-                    with open(filename, "w", encoding="utf-8") as f:
-                        f.write(summary_text)
-                    logger.error(f"JSON 파싱 실패. 원본 응답을 {filename}에 저장했습니다.")
-                except Exception as save_error:
-                    logger.error(f"파일 저장 중 오류: {save_error}")
-                
-                raise Exception(f"AI 응답을 JSON으로 파싱할 수 없습니다: {str(e)}")
-            except Exception as e:
-                raise Exception(f"응답 데이터 구조가 올바르지 않습니다: {str(e)}")
+                    summary_items = self._generate_with_fallback(prompt, self._parse_items)
+                except InvalidResponseError as e:
+                    # 깨지거나 잘린 응답에서도 형식이 올바른 항목은 살림 (이 응답은 캐시되지 않음)
+                    cause = e.__cause__
+                    summary_items = self._salvage_items(e.text)
+                    if not summary_items:
+                        self._save_failed_response(e.text)
+                        if isinstance(cause, json.JSONDecodeError):
+                            raise Exception(f"AI 응답을 JSON으로 파싱할 수 없습니다: {str(cause)}")
+                        raise Exception(f"응답 데이터 구조가 올바르지 않습니다: {str(cause)}")
+                    logger.warning(f"응답 파싱 실패 ({cause}). 올바른 항목 {len(summary_items)}개를 복구했습니다.")
             
+            # 빠진 주제만 작은 후속 요청으로 보충
+            summary_items = self._repair_missing_items(
+                summary_items, request.news_list, clusters, request.max_length or 200
+            )
             return NewsSummaryResponse(summary=summary_items)
             
         except Exception as e:
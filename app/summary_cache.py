@@ -0,0 +1,191 @@
+import asyncio
+import gzip
+import hashlib
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Dict, Any, Tuple
+
+import orjson
+
+from config import settings
+from database import mongodb
+from async_database import async_mongodb
+from logger import get_logger
+
+logger = get_logger()
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 제공
+    brotli = None
+
+def build_summary_payload(response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """최근 요약 문서를 /api/data 응답 형식으로 변환"""
+    if not response:
+        return {"summary_items": [], "created_at": None}
+    
+    if 'data' in response:
+        summary_items = response.get('data', {}).get('summary_items', [])
+        created_at = response.get('data', {}).get('created_at')
+    else:
+        summary_items = response.get('summary_items', [])
+        created_at = response.get('created_at')
+    
+    return {"summary_items": summary_items, "created_at": created_at}
+
+class SummaryPayload:
+    """요약 버전별로 한 번만 직렬화/압축해 둔 /api/data 응답 본문과 캐시 검증 헤더"""
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.body = orjson.dumps(data)
+        self.encoded = {"gzip": gzip.compress(self.body, compresslevel=6)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(self.body, quality=9)
+        self.etag_base = hashlib.sha256(self.body).hexdigest()[:32]
+        self.last_modified = self._parse_created_at(data.get("created_at"))
+
+    @staticmethod
+    def _parse_created_at(created_at: Optional[str]) -> Optional[datetime]:
+        if not created_at:
+            return None
+        try:
+            # created_at은 서버 로컬 시간 기준 isoformat
+            return datetime.fromisoformat(created_at).astimezone(timezone.utc).replace(microsecond=0)
+        except ValueError:
+            return None
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """표현(인코딩)별로 다른 strong ETag"""
+        return f'"{self.etag_base}-{encoding}"' if encoding else f'"{self.etag_base}"'
+
+    def last_modified_header(self) -> Optional[str]:
+        return format_datetime(self.last_modified, usegmt=True) if self.last_modified else None
+
+    @staticmethod
+    def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+        """Accept-Encoding을 {인코딩: q값}으로 변환 (q값이 잘못되면 해당 항목 무시)"""
+        accepted = {}
+        for part in (accept_encoding or "").split(","):
+            coding, *params = [value.strip() for value in part.split(";")]
+            if not coding:
+                continue
+            q = 1.0
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = -1.0
+            if q >= 0:
+                accepted[coding.lower()] = q
+        return accepted
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Accept-Encoding에 맞는 (본문, 인코딩) 선택 (q값이 높은 쪽, 같으면 br > gzip > 원본, q=0은 제외)"""
+        accepted = self._parse_accept_encoding(accept_encoding)
+        best, best_q = None, 0.0
+        for encoding in ("br", "gzip"):
+            q = accepted.get(encoding, accepted.get("*", 0.0))
+            if encoding in self.encoded and q > best_q:
+                best, best_q = encoding, q
+        if best is None:
+            return self.body, None
+        return self.encoded[best], best
+
+    def is_not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """조건부 요청 검사 (If-None-Match 우선, 없으면 If-Modified-Since)"""
+        if if_none_match:
+            for tag in if_none_match.split(","):
+                tag = tag.strip()
+                if tag == "*":
+                    return True
+                tag = tag.removeprefix("W/").strip('"')
+                if tag.split("-")[0] == self.etag_base:
+                    return True
+            return False
+        if if_modified_since and self.last_modified:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+class LatestSummaryCache:
+    """최근 요약을 메모리에 보관하는 캐시 (비동기 MongoDB로 로드)
+
+    같은 프로세스의 저장/삭제는 MongoDB 리스너로 즉시 무효화되고, 다른 프로세스(워커)의 저장은
+    최신 _id 폴링 또는 변경 스트림으로 감지한다.
+    """
+    def __init__(self):
+        self._lock: Optional[asyncio.Lock] = None
+        self._payload: Optional[SummaryPayload] = None
+        self._version: Optional[str] = None
+        self._stale = True
+        self._checked_at = 0.0
+        self._watcher: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._lock = asyncio.Lock()
+        # 스케줄러 스레드(동기 클라이언트)에서 저장해도 무효화되도록 등록 (플래그만 변경하므로 스레드 안전)
+        mongodb.add_summary_listener(self.invalidate)
+        if settings.summary_cache_change_stream:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._watcher:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    def invalidate(self, *args):
+        self._stale = True
+
+    async def get(self) -> SummaryPayload:
+        """캐시된 응답 반환 (무효화되었거나 다른 프로세스에서 새 요약이 저장되었으면 다시 로드)"""
+        if self._is_fresh():
+            return self._payload
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 갱신했으면 그대로 사용 (single-flight)
+            if self._is_fresh():
+                return self._payload
+            if not self._stale and self._payload is not None:
+                # 저렴한 버전 확인: 최신 요약 _id만 조회
+                self._checked_at = time.monotonic()
+                if await async_mongodb.get_recent_summary_id() == self._version:
+                    return self._payload
+                logger.info("새 요약 감지, 캐시 갱신")
+            await self._load()
+            return self._payload
+
+    def _is_fresh(self) -> bool:
+        return (
+            not self._stale
+            and self._payload is not None
+            and time.monotonic() - self._checked_at < settings.summary_cache_poll_interval
+        )
+
+    async def _load(self):
+        self._stale = False
+        response = await async_mongodb.get_recent_summary_item()
+        self._payload = SummaryPayload(build_summary_payload(response))
+        self._version = response.get("_id") if response else None
+        self._checked_at = time.monotonic()
+
+    async def _watch(self):
+        """MongoDB 변경 스트림으로 요약 컬렉션 변경 감지 (레플리카셋에서만 동작)"""
+        try:
+            async with await async_mongodb.get_collection().watch() as stream:
+                logger.info("요약 캐시 변경 스트림 감시 시작")
+                async for _ in stream:
+                    self.invalidate()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"변경 스트림을 사용할 수 없어 버전 폴링으로 동작합니다: {e}")
+
+latest_summary_cache = LatestSummaryCache()
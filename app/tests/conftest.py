@@ -0,0 +1,46 @@
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+# 앱 모듈은 app/ 기준 절대 import를 사용하고, 프롬프트 템플릿 등은 작업 디렉터리(/app) 기준 경로로 읽음
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+os.chdir(APP_DIR)
+
+# 테스트 로그는 소스 트리 밖에 기록
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="anew-test-logs-"))
+
+# 요약 서비스는 import 시 API 키 설정만 확인하므로 테스트용 값 지정 (실제 호출 없음)
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+
+@pytest.fixture
+def db():
+    """테스트마다 임시 데이터베이스에 연결한 MongoDB (mongod에 접속할 수 없으면 건너뜀)"""
+    pymongo = pytest.importorskip("pymongo")
+    client = pymongo.MongoClient(MONGODB_URI, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except Exception as e:
+        pytest.skip(f"mongod에 접속할 수 없습니다: {e}")
+    finally:
+        client.close()
+
+    from config import settings
+    from database import MongoDB
+
+    database_name = f"anew_test_{uuid.uuid4().hex[:8]}"
+    original = settings.mongodb_database
+    settings.mongodb_database = database_name
+    mongodb = MongoDB()
+    mongodb.connect()
+    try:
+        yield mongodb
+    finally:
+        mongodb.client.drop_database(database_name)
+        mongodb.disconnect()
+        settings.mongodb_database = original
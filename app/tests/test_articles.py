@@ -0,0 +1,40 @@
+"""기사 원문 저장 테스트 (실제 mongod 필요, MONGODB_URI로 접속 불가 시 건너뜀)"""
+
+def test_upsert_stores_dollar_prefixed_text_verbatim(db):
+    news = {"press": "$press", "url": "https://n.news.naver.com/article/001/0000000001", "title": "$title", "content": "$100 인상"}
+
+    ids = db.upsert_articles([news])
+    article = db.articles.find_one({"_id": next(iter(ids.values()))})
+
+    assert article["press"] == "$press"
+    assert article["title"] == "$title"
+    assert article["content"] == "$100 인상"
+
+def test_upsert_keeps_updated_at_when_content_is_unchanged(db):
+    news = {"press": "연합뉴스", "url": "https://n.news.naver.com/article/001/0000000002", "title": "제목", "content": "본문"}
+
+    ids = db.upsert_articles([news])
+    first = db.articles.find_one({"_id": next(iter(ids.values()))})
+    db.upsert_articles([news])
+    second = db.articles.find_one({"_id": next(iter(ids.values()))})
+
+    assert second["updated_at"] == first["updated_at"]
+    assert second["last_seen_at"] >= first["last_seen_at"]
+
+def test_recently_seen_articles_are_served_as_crawl_cache(db):
+    from datetime import datetime, timedelta
+
+    from config import settings
+
+    fresh = {"press": "연합뉴스", "url": "https://n.news.naver.com/mnews/article/001/0000000003", "title": "새 기사", "content": "본문"}
+    stale = {"press": "연합뉴스", "url": "https://n.news.naver.com/mnews/article/001/0000000004", "title": "지난 기사", "content": "본문"}
+    db.upsert_articles([fresh, stale])
+    db.articles.update_one(
+        {"url": stale["url"]},
+        {"$set": {"last_seen_at": datetime.now() - timedelta(hours=settings.article_cache_ttl + 1)}}
+    )
+
+    cached = db.get_cached_articles([fresh["url"], stale["url"]])
+
+    assert list(cached) == [fresh["url"]]
+    assert cached[fresh["url"]]["content"] == "본문"
@@ -0,0 +1,34 @@
+"""기사 주제 클러스터링 테스트"""
+from summary.clustering import cluster_news
+
+def article(url, press, title, content=""):
+    return {"url": url, "press": press, "title": title, "content": content}
+
+NEWS = [
+    article("u1", "매일경제", "한국은행 기준금리 동결 결정", "한국은행 금융통화위원회가 기준금리를 연 3.5%로 동결했다."),
+    article("u2", "한국경제", "삼성전자 반도체 실적 개선", "삼성전자의 반도체 부문 영업이익이 크게 늘었다."),
+    article("u3", "서울경제", "한국은행 기준금리 동결 결정", "한국은행 금융통화위원회가 기준금리를 연 3.5%로 동결했다. 시장 예상과 같다."),
+    article("u4", "이데일리", "한국은행 기준금리 동결 배경은", "금융통화위원회는 물가와 가계부채를 고려해 기준금리를 동결했다."),
+]
+
+def test_groups_by_topic_and_orders_by_press_count():
+    clusters = cluster_news(NEWS, similarity_threshold=0.3, duplicate_threshold=0.9)
+
+    assert [cluster.size for cluster in clusters] == [3, 1]
+    assert clusters[0].press_count == 3
+    assert clusters[1].articles[0]["url"] == "u2"
+
+def test_near_duplicates_keep_longest_article_as_representative():
+    clusters = cluster_news(NEWS, similarity_threshold=0.3, duplicate_threshold=0.8)
+
+    rate = clusters[0]
+    assert [a["url"] for a in rate.articles] == ["u3", "u4"]
+    assert rate.duplicate_urls == ["u1"]
+    assert rate.size == 3
+
+def test_is_deterministic_and_handles_empty_input():
+    first = cluster_news(NEWS, 0.3, 0.9)
+    second = cluster_news(NEWS, 0.3, 0.9)
+
+    assert [c.model_dump() for c in first] == [c.model_dump() for c in second]
+    assert cluster_news([], 0.3, 0.9) == []
@@ -0,0 +1,10 @@
+"""언론사별 크롤링 상태 저장 테스트 (실제 mongod 필요, MONGODB_URI로 접속 불가 시 건너뜀)"""
+
+def test_last_aid_never_moves_backwards(db):
+    db.save_crawl_state("009", 120, ["u120", "u119"])
+    db.save_crawl_state("009", 100, ["u100"])
+    db.save_crawl_state("009", None, ["u101"])
+
+    state = db.get_crawl_state("009")
+    assert state["last_aid"] == 120
+    assert state["recent_urls"] == ["u101"]
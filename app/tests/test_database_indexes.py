@@ -0,0 +1,20 @@
+"""MongoDB 인덱스 생성 테스트 (실제 mongod 필요, MONGODB_URI로 접속 불가 시 건너뜀)"""
+
+def ttl_seconds(collection, name):
+    return collection.index_information()[name]["expireAfterSeconds"]
+
+def test_changed_ttl_setting_updates_existing_index(db, monkeypatch):
+    from config import settings
+
+    assert ttl_seconds(db.llm_cache, "created_at_ttl") == int(settings.llm_cache_ttl * 3600)
+
+    # 만료 시간 설정을 바꿔 다시 연결해도 실패하지 않고 기존 TTL 인덱스가 갱신됨
+    monkeypatch.setattr(settings, "llm_cache_ttl", settings.llm_cache_ttl + 1)
+    db.connect()
+    assert ttl_seconds(db.llm_cache, "created_at_ttl") == int(settings.llm_cache_ttl * 3600)
+
+def test_unused_created_at_index_is_dropped(db):
+    db.collection.create_index([("created_at", -1)], name="created_at_desc")
+
+    db.connect()
+    assert "created_at_desc" not in db.collection.index_information()
@@ -0,0 +1,56 @@
+"""호스트별 요청 속도 제한 테스트 (가짜 시계 사용)"""
+import crawl
+from crawl import HostRateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+def test_requests_to_same_host_are_spaced(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawl, "time", clock)
+    limiter = HostRateLimiter(rate=4)
+
+    for _ in range(3):
+        limiter.wait("https://n.news.naver.com/mnews/article/009/1")
+
+    assert clock.sleeps == [0.25, 0.25]
+
+def test_hosts_are_limited_independently(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawl, "time", clock)
+    limiter = HostRateLimiter(rate=2)
+
+    limiter.wait("https://news.naver.com/main/list.naver")
+    limiter.wait("https://n.news.naver.com/mnews/article/009/1")
+
+    assert clock.sleeps == []
+
+def test_elapsed_time_counts_toward_interval(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawl, "time", clock)
+    limiter = HostRateLimiter(rate=1)
+
+    limiter.wait("https://news.naver.com/a")
+    clock.now += 0.4
+    limiter.wait("https://news.naver.com/b")
+
+    assert clock.sleeps == [0.6]
+
+def test_zero_rate_disables_limit(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawl, "time", clock)
+    limiter = HostRateLimiter(rate=0)
+
+    for _ in range(5):
+        limiter.wait("https://news.naver.com/a")
+
+    assert clock.sleeps == []
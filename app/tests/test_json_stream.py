@@ -0,0 +1,50 @@
+"""스트리밍 JSON 배열 파서 테스트"""
+from summary.json_stream import JsonArrayStreamParser, parse_json_items
+
+def feed_in_chunks(text, size):
+    parser = JsonArrayStreamParser()
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return parser, items
+
+def test_items_are_emitted_as_soon_as_they_complete():
+    parser = JsonArrayStreamParser()
+
+    assert parser.feed('```json\n[{"title": "A"}, {"ti') == [{"title": "A"}]
+    assert parser.feed('tle": "B"}]\n```') == [{"title": "B"}]
+    assert parser.done
+
+def test_chunk_boundaries_do_not_change_result():
+    text = '[{"title": "괄호 [1] {중괄호}", "quote": "\\"인용\\""}, {"list": [1, 2]}]'
+
+    for size in (1, 2, 5, len(text)):
+        parser, items = feed_in_chunks(text, size)
+        assert items == [{"title": "괄호 [1] {중괄호}", "quote": "\"인용\""}, {"list": [1, 2]}]
+        assert parser.done
+
+def test_truncated_stream_keeps_completed_items():
+    parser, items = feed_in_chunks('[{"title": "A"}, {"title": "B"}, {"title": "C', 7)
+
+    assert items == [{"title": "A"}, {"title": "B"}]
+    assert not parser.done
+
+def test_malformed_middle_item_is_skipped():
+    items = parse_json_items('[{"title": "A"}, {"title": B}, {"title": "C"}]')
+
+    assert items == [{"title": "A"}, {"title": "C"}]
+
+def test_missing_comma_between_items():
+    items = parse_json_items('[{"title": "A"} {"title": "B"}]')
+
+    assert items == [{"title": "A"}, {"title": "B"}]
+
+def test_preamble_with_brackets_is_ignored():
+    text = 'Here are [3] topics:\n[\n  {"title": "A"}, {"title": "B"}, {"title": "C"}\n]'
+
+    assert parse_json_items(text) == [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+    for size in (1, 3):
+        assert feed_in_chunks(text, size)[1] == [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+
+def test_single_object_response():
+    assert parse_json_items('결과: {"title": "A", "tags": ["x"]}') == [{"title": "A", "tags": ["x"]}]
@@ -0,0 +1,23 @@
+"""MongoDB 리스 락 테스트 (실제 mongod 필요, MONGODB_URI로 접속 불가 시 건너뜀)"""
+import time
+
+def test_acquire_is_exclusive_until_release(db):
+    assert db.acquire_lock("scheduler", "a", 60)
+    assert not db.acquire_lock("scheduler", "b", 60)
+    # 보유자는 다시 획득(연장)할 수 있음
+    assert db.acquire_lock("scheduler", "a", 60)
+    assert db.renew_lock("scheduler", "a", 60)
+    assert not db.renew_lock("scheduler", "b", 60)
+
+    db.release_lock("scheduler", "a")
+    assert db.acquire_lock("scheduler", "b", 60)
+
+def test_expired_lease_is_taken_over(db):
+    assert db.acquire_lock("scheduler", "a", 1)
+    assert not db.acquire_lock("scheduler", "b", 60)
+    time.sleep(1.5)
+    assert db.acquire_lock("scheduler", "b", 60)
+    # 인계된 뒤 이전 보유자는 갱신/해제할 수 없음
+    assert not db.renew_lock("scheduler", "a", 60)
+    db.release_lock("scheduler", "a")
+    assert not db.acquire_lock("scheduler", "a", 60)
@@ -0,0 +1,29 @@
+"""기사 URL 정규화/기사 번호 추출 테스트"""
+import pytest
+
+from news_url import getArticleId, getOidFromUrl, normalizeNewsUrl
+
+CANONICAL = "https://n.news.naver.com/mnews/article/009/0005123456"
+
+@pytest.mark.parametrize("url", [
+    "https://n.news.naver.com/mnews/article/009/0005123456",
+    "https://n.news.naver.com/mnews/article/009/0005123456?sid=101",
+    "https://n.news.naver.com/article/009/0005123456#comment",
+    "https://news.naver.com/main/read.naver?mode=LPOD&mid=sec&oid=009&aid=0005123456",
+])
+def test_naver_article_variants_share_canonical_url(url):
+    assert normalizeNewsUrl(url) == CANONICAL
+
+def test_other_urls_drop_fragment_and_sort_query():
+    url = "HTTPS://Example.COM/news?b=2&a=1#top"
+
+    assert normalizeNewsUrl(url) == "https://example.com/news?a=1&b=2"
+
+@pytest.mark.parametrize("url, aid, oid", [
+    ("https://n.news.naver.com/mnews/article/015/0004999999?sid=101", 4999999, "015"),
+    ("https://news.naver.com/main/read.naver?oid=011&aid=0004321000", 4321000, "011"),
+    ("https://example.com/news/1", None, None),
+])
+def test_article_id_and_oid(url, aid, oid):
+    assert getArticleId(url) == aid
+    assert getOidFromUrl(url) == oid
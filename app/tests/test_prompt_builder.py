@@ -0,0 +1,61 @@
+"""프롬프트 토큰 예산 배분/본문 자르기 테스트"""
+import json
+
+from summary.prompt_builder import PromptBuilder, estimate_tokens, strip_boilerplate, trim_text
+
+TEMPLATE = "다음 기사를 요약하세요 ({max_length}자 이내):\n{news_json}"
+
+def sentences(prefix, count):
+    return " ".join(f"{prefix} 관련 {i}번째 문장은 시장 상황을 설명한다." for i in range(count))
+
+def test_trim_text_keeps_leading_sentences_within_budget():
+    text = "첫 문장이다. 두 번째 문장이다. 세 번째 문장이다."
+    budget = estimate_tokens("첫 문장이다.") + estimate_tokens("두 번째 문장이다.")
+
+    assert trim_text(text, budget) == "첫 문장이다. 두 번째 문장이다."
+    assert trim_text(text, 10_000) == text
+
+def test_trim_text_cuts_single_long_sentence_by_ratio():
+    text = "가" * 300
+
+    trimmed = trim_text(text, 20)
+    assert 0 < len(trimmed) < len(text)
+    assert text.startswith(trimmed)
+
+def test_strip_boilerplate_removes_byline_and_copyright():
+    text = "[서울=홍길동 기자] 금리가 동결됐다.\n홍길동 기자 hong@mk.co.kr\nⓒ 매일경제, 무단전재 및 재배포 금지"
+
+    assert strip_boilerplate(text) == "금리가 동결됐다."
+
+def test_build_fits_budget_and_splits_by_length():
+    news = [
+        {"title": "긴 기사", "url": "u1", "content": sentences("금리", 60)},
+        {"title": "짧은 기사", "url": "u2", "content": sentences("환율", 5)},
+    ]
+    builder = PromptBuilder(token_budget=600)
+
+    prompt = builder.build(TEMPLATE, news, max_length=200)
+
+    assert estimate_tokens(prompt) <= 600 + 2 * len(news)  # 문장 단위 반올림 오차 허용
+    articles = json.loads(prompt.split("\n", 1)[1])
+    long_article, short_article = articles
+    assert len(long_article["content"]) < len(news[0]["content"])
+    assert long_article["content"] and short_article["content"]
+    assert estimate_tokens(long_article["content"]) > estimate_tokens(short_article["content"])
+    assert "{max_length}" not in prompt and "200자" in prompt
+
+def test_build_leaves_short_input_and_caller_payload_untouched():
+    news = [{"title": "기사", "url": "u1", "content": "짧은 본문이다."}]
+
+    prompt = PromptBuilder(token_budget=10_000).build(TEMPLATE, news, max_length=100)
+
+    assert json.loads(prompt.split("\n", 1)[1])[0]["content"] == "짧은 본문이다."
+    assert news[0]["content"] == "짧은 본문이다."
+
+def test_build_trims_articles_inside_topic_payload():
+    topics = [{"topic": "금리", "articles": [{"title": "기사", "url": "u1", "content": sentences("금리", 80)}]}]
+
+    prompt = PromptBuilder(token_budget=300).build(TEMPLATE, topics, max_length=100)
+
+    content = json.loads(prompt.split("\n", 1)[1])[0]["articles"][0]["content"]
+    assert 0 < len(content) < len(topics[0]["articles"][0]["content"])
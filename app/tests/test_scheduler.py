@@ -0,0 +1,128 @@
+"""정기 실행 일정 계산 테스트 (time.time 고정, MongoDB/브라우저 불필요)"""
+import time
+
+import pytest
+
+from config import settings
+from scheduler import NewsScheduler
+
+INTERVAL = 3600
+START = 1_700_000_000.0
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(settings, "schedule_jitter", 0)
+    monkeypatch.setattr(settings, "schedule_misfire_policy", "run_once")
+    monkeypatch.setattr(settings, "schedule_misfire_grace", 600)
+    return NewsScheduler()
+
+def freeze(monkeypatch, now):
+    monkeypatch.setattr(time, "time", lambda: now)
+
+def test_on_time_runs_at_next_slot(scheduler, monkeypatch):
+    freeze(monkeypatch, START + 120)
+
+    assert scheduler._next_run_time(START, INTERVAL) == (START + INTERVAL, START + INTERVAL)
+
+def test_one_missed_slot_within_grace_runs_now(scheduler, monkeypatch):
+    now = START + INTERVAL + 300
+    freeze(monkeypatch, now)
+
+    assert scheduler._next_run_time(START, INTERVAL) == (START + INTERVAL, now)
+
+def test_several_missed_slots_use_latest_slot_for_grace(scheduler, monkeypatch):
+    # 가장 오래된 일정은 2시간 넘게 지났지만 가장 최근 일정은 5분 전
+    now = START + 3 * INTERVAL + 300
+    freeze(monkeypatch, now)
+
+    assert scheduler._next_run_time(START, INTERVAL) == (START + 3 * INTERVAL, now)
+
+def test_missed_slot_beyond_grace_is_skipped(scheduler, monkeypatch):
+    freeze(monkeypatch, START + 2 * INTERVAL + 900)
+
+    assert scheduler._next_run_time(START, INTERVAL) == (START + 3 * INTERVAL, START + 3 * INTERVAL)
+
+def test_skip_policy_waits_for_next_slot(scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "schedule_misfire_policy", "skip")
+    freeze(monkeypatch, START + 2 * INTERVAL + 60)
+
+    assert scheduler._next_run_time(START, INTERVAL) == (START + 3 * INTERVAL, START + 3 * INTERVAL)
+
+class FakeWorker:
+    """목록/상세 페이지 대신 고정 데이터를 반환하는 CrawlWorker"""
+    created = 0
+
+    def __init__(self, driver_factory):
+        FakeWorker.created += 1
+
+    def get_news_urls(self, mediaId, last_aid=None):
+        return [f"https://n.news.naver.com/mnews/article/{mediaId}/{aid}" for aid in (3, 2, 1)]
+
+    def get_news(self, url):
+        if url.endswith("/2"):
+            return None
+        return {"title": f"제목 {url[-5:]}", "content": "본문"}
+
+    def close(self):
+        pass
+
+def test_concurrent_crawl_upserts_in_batches_and_keeps_order(scheduler, monkeypatch):
+    import scheduler as scheduler_module
+    from database import mongodb
+
+    batches = []
+    def upsert_articles(news_list):
+        batches.append([news["url"] for news in news_list])
+        return {news["url"]: f"id-{news['url'][-5:]}" for news in news_list}
+
+    monkeypatch.setattr(scheduler_module, "CrawlWorker", FakeWorker)
+    monkeypatch.setattr(mongodb, "upsert_articles", upsert_articles)
+    monkeypatch.setattr(settings, "crawl_incremental", False)
+    monkeypatch.setattr(settings, "article_cache_enabled", False)
+    monkeypatch.setattr(settings, "crawl_workers", 2)
+    monkeypatch.setattr(settings, "crawl_upsert_batch", 3)
+    FakeWorker.created = 0
+
+    newsData, article_ids = scheduler.collect_news_concurrently(["009", "015"])
+
+    urls = [news["url"] for press in newsData.values() for news in press]
+    assert urls == [
+        "https://n.news.naver.com/mnews/article/009/3", "https://n.news.naver.com/mnews/article/009/1",
+        "https://n.news.naver.com/mnews/article/015/3", "https://n.news.naver.com/mnews/article/015/1",
+    ]
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert sorted(article_ids) == sorted(urls)
+    assert FakeWorker.created <= 2  # 스레드당 워커 하나
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_crawl_state_is_saved_after_details_with_collected_aids_only(scheduler, monkeypatch, workers):
+    import scheduler as scheduler_module
+    from database import mongodb
+
+    events = []
+    class RecordingWorker(FakeWorker):
+        def get_news(self, url):
+            events.append(("fetch", url))
+            return super().get_news(url)
+
+    def save_crawl_state(media_id, last_aid, recent_urls):
+        events.append(("save", media_id, last_aid, len(recent_urls)))
+
+    monkeypatch.setattr(scheduler_module, "CrawlWorker", RecordingWorker)
+    monkeypatch.setattr(scheduler, "worker", RecordingWorker(None))
+    monkeypatch.setattr(mongodb, "get_crawl_state", lambda media_id: {"last_aid": 1, "recent_urls": []})
+    monkeypatch.setattr(mongodb, "save_crawl_state", save_crawl_state)
+    monkeypatch.setattr(mongodb, "upsert_articles", lambda news_list: {})
+    monkeypatch.setattr(settings, "crawl_incremental", True)
+    monkeypatch.setattr(settings, "article_cache_enabled", False)
+    monkeypatch.setattr(settings, "crawl_workers", workers)
+
+    if workers > 1:
+        scheduler.collect_news_concurrently(["009"])
+    else:
+        scheduler.collect_news(["009"])
+
+    # 상세 페이지를 모두 가져온 뒤에 저장하며, 실패한 기사(2)가 아닌 성공한 기사 번호로만 올림
+    assert events[-1] == ("save", "009", 3, 3)
+    assert [event[0] for event in events].count("save") == 1
+    assert sum(1 for event in events if event[0] == "fetch") == 3
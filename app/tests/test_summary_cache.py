@@ -0,0 +1,68 @@
+"""/api/data 조건부 요청(ETag/Last-Modified) 및 압축 인코딩 선택 테스트"""
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from summary_cache import SummaryPayload, brotli
+
+CREATED_AT = "2026-10-18T09:30:00.123456"
+
+@pytest.fixture
+def payload():
+    return SummaryPayload({"summary_items": [{"title": "금리 동결"}], "created_at": CREATED_AT})
+
+def test_if_none_match_list_matches_any_encoding_variant(payload):
+    header = f'"other", {payload.etag("gzip")}'
+
+    assert payload.is_not_modified(header, None)
+    assert not payload.is_not_modified('"other", "another"', None)
+
+def test_if_none_match_accepts_weak_etag(payload):
+    assert payload.is_not_modified(f"W/{payload.etag('br')}", None)
+
+def test_if_none_match_wildcard(payload):
+    assert payload.is_not_modified("*", None)
+
+def test_if_none_match_takes_precedence_over_if_modified_since(payload):
+    assert not payload.is_not_modified('"other"', payload.last_modified_header())
+
+def test_if_modified_since_fallback(payload):
+    later = format_datetime(payload.last_modified + timedelta(hours=1), usegmt=True)
+    earlier = format_datetime(payload.last_modified - timedelta(seconds=1), usegmt=True)
+
+    assert payload.is_not_modified(None, payload.last_modified_header())
+    assert payload.is_not_modified(None, later)
+    assert not payload.is_not_modified(None, earlier)
+    assert not payload.is_not_modified(None, "not a date")
+
+def test_last_modified_is_second_precision_utc(payload):
+    expected = datetime.fromisoformat(CREATED_AT).astimezone().replace(microsecond=0)
+
+    assert payload.last_modified == expected
+    assert payload.last_modified_header().endswith("GMT")
+
+@pytest.mark.skipif(brotli is None, reason="brotli 미설치")
+def test_prefers_brotli_then_gzip(payload):
+    body, encoding = payload.select("gzip, deflate, br")
+
+    assert encoding == "br"
+    assert brotli.decompress(body) == payload.body
+    assert payload.select("gzip, br;q=0")[1] == "gzip"
+    assert payload.select("gzip;q=1.0, br;q=0.5")[1] == "gzip"
+
+def test_gzip_and_identity_negotiation(payload):
+    import gzip
+
+    body, encoding = payload.select("gzip")
+    assert encoding == "gzip"
+    assert gzip.decompress(body) == payload.body
+
+    assert payload.select("") == (payload.body, None)
+    assert payload.select("identity") == (payload.body, None)
+    assert payload.select("gzip;q=0, br;q=0") == (payload.body, None)
+    assert payload.select("*;q=0") == (payload.body, None)
+    assert payload.select("*")[1] == ("br" if brotli is not None else "gzip")
+
+def test_etag_differs_per_encoding(payload):
+    assert len({payload.etag(), payload.etag("gzip"), payload.etag("br")}) == 3